@@ -1,16 +1,35 @@
 # Quantum Navigator v2.0 - Neutral Atom Driver
 # Based on Pulser (Pasqal) for FPQA orchestration
 
-from .pulser_adapter import PulserAdapter
-from .validator import PulserValidator, TopologicalViolationError, PhysicsConstraintError
-from .schema import NeutralAtomJob, NeutralAtomRegister, AnalogPulse
+# Exports are resolved lazily (PEP 562), so importing a single submodule such
+# as `drivers.neutral_atom.schema` does not pull in the validator's
+# scipy/numba stack or the Pulser adapter.
+from importlib import import_module
+
+_EXPORTS = {
+    "PulserAdapter": ".pulser_adapter",
+    "PulserValidator": ".validator",
+    "TopologicalViolationError": ".validator",
+    "PhysicsConstraintError": ".validator",
+    "NeutralAtomJob": ".schema",
+    "NeutralAtomRegister": ".schema",
+    "AnalogPulse": ".schema",
+}
 
 __all__ = [
     "PulserAdapter",
-    "PulserValidator", 
+    "PulserValidator",
     "TopologicalViolationError",
     "PhysicsConstraintError",
     "NeutralAtomJob",
     "NeutralAtomRegister",
     "AnalogPulse",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -260,7 +260,7 @@ class PulserAdapter:
                     return result
             
             # 6. Compile operations
-            for op in sorted(job.operations, key=lambda o: o.start_time):
+            for op in job.operations_by_start:
                 self._compile_operation(sequence, op, job.register)
                 result.num_pulses += 1
             
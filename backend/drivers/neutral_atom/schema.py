@@ -16,11 +16,16 @@ References:
 """
 
 from __future__ import annotations
-from typing import Literal, Optional, Union
+from dataclasses import dataclass
+from functools import cached_property
+from itertools import chain
+from typing import Any, Literal, Optional, Union
 from enum import Enum
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 import math
 
+import numpy as np
+
 
 # =============================================================================
 # ENUMS
@@ -43,6 +48,15 @@ class TrapRole(str, Enum):
     STORAGE = "STORAGE"  # Storage zone atoms
 
 
+# Integer codes for TrapRole in NeutralAtomRegister.roles_arr
+TRAP_ROLE_CODES: dict[TrapRole, int] = {
+    TrapRole.SLM: 0,
+    TrapRole.AOD: 1,
+    TrapRole.BUS: 2,
+    TrapRole.STORAGE: 3,
+}
+
+
 class LayoutType(str, Enum):
     """Predefined layout patterns for atom registers."""
     TRIANGULAR = "triangular"
@@ -88,12 +102,20 @@ class ZoneType(str, Enum):
     BUFFER = "BUFFER"
 
 
+# Integer codes for ZoneType in NeutralAtomRegister.zone_types_arr
+ZONE_TYPE_CODES: dict[ZoneType, int] = {
+    zone_type: code for code, zone_type in enumerate(ZoneType)
+}
+
+
 # =============================================================================
 # GEOMETRY: Atom Register Definition
 # =============================================================================
 
 class AtomPosition(BaseModel):
     """Single atom position in the register."""
+    model_config = ConfigDict(frozen=True)
+    
     id: int = Field(..., ge=0, description="Unique atom identifier")
     x: float = Field(..., description="X coordinate in micrometers")
     y: float = Field(..., description="Y coordinate in micrometers")
@@ -114,6 +136,8 @@ class ZoneDefinition(BaseModel):
     - Entanglement zone is where Rydberg pulses are applied
     - Readout zone is where fluorescence measurement occurs
     """
+    model_config = ConfigDict(frozen=True)
+    
     zone_id: str = Field(..., description="Unique zone identifier")
     zone_type: ZoneType = Field(..., description="Functional type of zone")
     
@@ -265,6 +289,13 @@ class NeutralAtomRegister(BaseModel):
     Zoned Architecture (v2.1):
     - Optional zones define functional regions (Storage, Entanglement, Readout)
     - Operations are validated against zone types
+    
+    Vectorized access: `xy`, `roles_arr`, `aod_rows`, `aod_cols` and `ids`
+    expose the atom list as read-only NumPy arrays (struct of arrays), built
+    on first use. `zone_bounds` and `zone_types_arr` do the same for the
+    zones.
+    The views are refreshed when `atoms`, `zones` or the distance limits are
+    reassigned; mutate atoms by assigning a new list, not in place.
     """
     layout_type: LayoutType = Field(default=LayoutType.ARBITRARY)
     min_atom_distance: float = Field(default=4.0, ge=1.0, le=20.0, 
@@ -289,26 +320,101 @@ class NeutralAtomRegister(BaseModel):
             raise ValueError("Duplicate atom IDs detected in register")
         return atoms
     
+    @classmethod
+    def from_arrays(
+        cls,
+        xy: np.ndarray,
+        roles: Optional[np.ndarray] = None,
+        ids: Optional[np.ndarray] = None,
+        aod_rows: Optional[np.ndarray] = None,
+        aod_cols: Optional[np.ndarray] = None,
+        **kwargs: Any
+    ) -> 'NeutralAtomRegister':
+        """
+        Build a register from struct-of-arrays input.
+        
+        The whole register is validated in a single model_validate call on
+        plain dicts, which keeps per-atom validation inside pydantic-core
+        instead of one Python-level AtomPosition(...) call per atom.
+        
+        Args:
+            xy: (n, 2) coordinates in µm
+            roles: (n,) TRAP_ROLE_CODES values (default: all SLM)
+            ids: (n,) atom IDs (default: 0..n-1)
+            aod_rows, aod_cols: (n,) AOD grid indices, -1 for none
+            **kwargs: Other NeutralAtomRegister fields
+        """
+        xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        n = len(xy)
+        atoms: list[dict[str, Any]] = [{'x': x, 'y': y} for x, y in xy.tolist()]
+        id_list = range(n) if ids is None else np.asarray(ids).tolist()
+        for atom, atom_id in zip(atoms, id_list):
+            atom['id'] = atom_id
+        if roles is not None:
+            code_roles = {code: role for role, code in TRAP_ROLE_CODES.items()}
+            for atom, code in zip(atoms, np.asarray(roles).tolist()):
+                atom['role'] = code_roles[code]
+        for key, values in (('aod_row', aod_rows), ('aod_col', aod_cols)):
+            if values is not None:
+                for atom, v in zip(atoms, np.asarray(values).tolist()):
+                    if v >= 0:
+                        atom[key] = v
+        return cls.model_validate({**kwargs, 'atoms': atoms})
+    
+    @classmethod
+    def from_grid(
+        cls,
+        n: int,
+        spacing: float,
+        role: TrapRole = TrapRole.SLM,
+        cols: Optional[int] = None,
+        **kwargs: Any
+    ) -> 'NeutralAtomRegister':
+        """
+        Build n atoms on a square grid, row-major from the origin.
+        
+        Args:
+            n: Number of atoms (IDs 0..n-1)
+            spacing: Grid pitch in µm
+            role: Trap role for every atom
+            cols: Atoms per row (default: n, a single row along x)
+            **kwargs: Other NeutralAtomRegister fields
+        """
+        cols = n if cols is None else cols
+        i = np.arange(n)
+        xy = np.column_stack((i % cols * spacing, i // cols * spacing))
+        return cls.from_arrays(
+            xy, roles=np.full(n, TRAP_ROLE_CODES[role]), **kwargs
+        )
+    
     def get_atom_by_id(self, atom_id: int) -> Optional[AtomPosition]:
-        """Retrieve atom by its ID."""
-        for atom in self.atoms:
-            if atom.id == atom_id:
-                return atom
+        """Retrieve atom by its ID (binary search over the sorted ID array)."""
+        order, sorted_ids = self._id_index
+        k = int(np.searchsorted(sorted_ids, atom_id))
+        if k < len(sorted_ids) and sorted_ids[k] == atom_id:
+            return self.atoms[int(order[k])]
         return None
     
     def get_aod_atoms(self) -> list[AtomPosition]:
         """Get all mobile (AOD) atoms."""
-        return [a for a in self.atoms if a.role == TrapRole.AOD]
+        return self._atoms_with_role(TrapRole.AOD)
     
     def get_slm_atoms(self) -> list[AtomPosition]:
         """Get all static (SLM) atoms."""
-        return [a for a in self.atoms if a.role == TrapRole.SLM]
+        return self._atoms_with_role(TrapRole.SLM)
+    
+    def _atoms_with_role(self, role: TrapRole) -> list[AtomPosition]:
+        atoms = self.atoms
+        return [atoms[i] for i in np.flatnonzero(self.roles_arr == TRAP_ROLE_CODES[role]).tolist()]
     
     def get_zone_at_position(self, x: float, y: float) -> Optional[ZoneDefinition]:
         """Get the zone containing a given position (first match)."""
         if self.zones is None:
             return None
-        for zone in self.zones:
+        cell, grid = self._zone_grid
+        candidates = grid.get((math.floor(x / cell), math.floor(y / cell)), ())
+        for k in candidates:
+            zone = self.zones[k]
             if zone.contains_point(x, y):
                 return zone
         return None
@@ -324,7 +430,126 @@ class NeutralAtomRegister(BaseModel):
         """Get all zones of a specific type."""
         if self.zones is None:
             return []
-        return [z for z in self.zones if z.zone_type == zone_type]
+        zones = self.zones
+        return [zones[i] for i in np.flatnonzero(self.zone_types_arr == ZONE_TYPE_CODES[zone_type]).tolist()]
+    
+    # -------------------------------------------------------------------------
+    # Struct-of-arrays views of `atoms`
+    # -------------------------------------------------------------------------
+    
+    _SOA_CACHE = (
+        "xy", "roles_arr", "aod_rows", "aod_cols", "ids", "_id_index",
+        "zone_bounds", "zone_types_arr", "_zone_grid",
+        "_min_d2", "_blockade_r2",
+    )
+    _SOA_SOURCES = frozenset({"atoms", "min_atom_distance", "blockade_radius", "zones"})
+    
+    @staticmethod
+    def _readonly(arr: np.ndarray) -> np.ndarray:
+        arr.flags.writeable = False
+        return arr
+    
+    @cached_property
+    def xy(self) -> np.ndarray:
+        """Atom coordinates as a C-contiguous (n, 2) float64 array, in `atoms` order."""
+        return self._readonly(np.array([(a.x, a.y) for a in self.atoms], dtype=np.float64))
+    
+    @cached_property
+    def roles_arr(self) -> np.ndarray:
+        """Atom roles as int8 codes (see TRAP_ROLE_CODES)."""
+        return self._readonly(np.array([TRAP_ROLE_CODES[a.role] for a in self.atoms], dtype=np.int8))
+    
+    @cached_property
+    def aod_rows(self) -> np.ndarray:
+        """AOD grid rows as int32, -1 where unassigned."""
+        return self._readonly(np.array(
+            [-1 if a.aod_row is None else a.aod_row for a in self.atoms], dtype=np.int32
+        ))
+    
+    @cached_property
+    def aod_cols(self) -> np.ndarray:
+        """AOD grid columns as int32, -1 where unassigned."""
+        return self._readonly(np.array(
+            [-1 if a.aod_col is None else a.aod_col for a in self.atoms], dtype=np.int32
+        ))
+    
+    @cached_property
+    def ids(self) -> np.ndarray:
+        """Atom IDs as int64."""
+        return self._readonly(np.fromiter((a.id for a in self.atoms), dtype=np.int64, count=len(self.atoms)))
+    
+    @cached_property
+    def _id_index(self) -> tuple[np.ndarray, np.ndarray]:
+        """(argsort order, sorted IDs) for binary-search lookups."""
+        order = np.argsort(self.ids, kind='stable')
+        return order, self.ids[order]
+    
+    @cached_property
+    def _min_d2(self) -> float:
+        """min_atom_distance squared, for sqrt-free distance checks."""
+        return self.min_atom_distance * self.min_atom_distance
+    
+    @cached_property
+    def _blockade_r2(self) -> float:
+        """blockade_radius squared, for sqrt-free distance checks."""
+        return self.blockade_radius * self.blockade_radius
+    
+    @cached_property
+    def zone_bounds(self) -> np.ndarray:
+        """Zone bounding boxes as an (n_zones, 4) [x_min, x_max, y_min, y_max] array."""
+        zones = self.zones or []
+        return self._readonly(np.array(
+            [(z.x_min, z.x_max, z.y_min, z.y_max) for z in zones], dtype=np.float64
+        ).reshape(-1, 4))
+    
+    @cached_property
+    def zone_types_arr(self) -> np.ndarray:
+        """Zone types as int8 codes (see ZONE_TYPE_CODES)."""
+        zones = self.zones or []
+        return self._readonly(np.array([ZONE_TYPE_CODES[z.zone_type] for z in zones], dtype=np.int8))
+    
+    @cached_property
+    def _zone_grid(self) -> tuple[float, dict[tuple[int, int], list[int]]]:
+        """
+        Uniform grid over zone bounding boxes for get_zone_at_position.
+        
+        Returns (cell size, {cell: zone indices}); the cell size is the median
+        zone diagonal and each list keeps zone order, so the first match is
+        unchanged.
+        """
+        zones = self.zones or []
+        if not zones:
+            return 1.0, {}
+        cell = float(np.median([math.hypot(z.x_max - z.x_min, z.y_max - z.y_min) for z in zones]))
+        grid: dict[tuple[int, int], list[int]] = {}
+        for k, z in enumerate(zones):
+            for cx in range(math.floor(z.x_min / cell), math.floor(z.x_max / cell) + 1):
+                for cy in range(math.floor(z.y_min / cell), math.floor(z.y_max / cell) + 1):
+                    grid.setdefault((cx, cy), []).append(k)
+        return cell, grid
+    
+    def _invalidate_soa(self) -> None:
+        for name in self._SOA_CACHE:
+            self.__dict__.pop(name, None)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self._SOA_SOURCES:
+            self._invalidate_soa()
+    
+    def __eq__(self, other: object) -> bool:
+        # Cached arrays live in __dict__ next to the fields; compare fields only
+        if not isinstance(other, NeutralAtomRegister):
+            return NotImplemented
+        return type(self) is type(other) and all(
+            self.__dict__[name] == other.__dict__[name] for name in type(self).model_fields
+        )
+    
+    def model_copy(self, *, update: Optional[dict[str, Any]] = None, deep: bool = False) -> 'NeutralAtomRegister':
+        copy = super().model_copy(update=update, deep=deep)
+        if update and not self._SOA_SOURCES.isdisjoint(update):
+            copy._invalidate_soa()
+        return copy
 
 
 # =============================================================================
@@ -333,6 +558,8 @@ class NeutralAtomRegister(BaseModel):
 
 class WaveformSpec(BaseModel):
     """Specification for pulse waveform shape."""
+    model_config = ConfigDict(frozen=True)
+    
     type: WaveformType = Field(...)
     duration: float = Field(..., gt=0, description="Duration in nanoseconds")
     
@@ -369,6 +596,8 @@ class GlobalPulse(BaseModel):
     
     Implements Hamiltonian: H = (Ω/2)Σ|g⟩⟨r| + h.c. - ΔΣn_r
     """
+    model_config = ConfigDict(frozen=True)
+    
     op_type: Literal["global_pulse"] = "global_pulse"
     channel: ChannelType = Field(default=ChannelType.RYDBERG_GLOBAL)
     start_time: float = Field(..., ge=0, description="Start time in ns")
@@ -388,6 +617,8 @@ class LocalDetuning(BaseModel):
     Local detuning applied to specific atoms using DMD or local beams.
     Used for targeted addressing in digital-analog hybrid mode.
     """
+    model_config = ConfigDict(frozen=True)
+    
     op_type: Literal["local_detuning"] = "local_detuning"
     channel: ChannelType = Field(default=ChannelType.RAMAN_LOCAL)
     target_atoms: list[int] = Field(..., min_length=1, description="Atom IDs to address")
@@ -415,6 +646,8 @@ class ShuttleMove(BaseModel):
     - No row/column crossing in AOD grid (topological constraint)
     - Atoms must not collide during movement
     """
+    model_config = ConfigDict(frozen=True)
+    
     op_type: Literal["shuttle"] = "shuttle"
     atom_ids: list[int] = Field(..., min_length=1, description="AOD atom IDs to move")
     start_time: float = Field(..., ge=0, description="Start time in ns")
@@ -444,6 +677,8 @@ class RydbergGate(BaseModel):
     
     Requires atoms to be within blockade_radius for entanglement.
     """
+    model_config = ConfigDict(frozen=True)
+    
     op_type: Literal["rydberg_gate"] = "rydberg_gate"
     control_atom: int = Field(..., description="Control atom ID")
     target_atom: int = Field(..., description="Target atom ID")
@@ -462,6 +697,8 @@ class Measurement(BaseModel):
     Projective measurement in computational basis.
     Neutral atoms: fluorescence imaging of ground vs Rydberg state.
     """
+    model_config = ConfigDict(frozen=True)
+    
     op_type: Literal["measure"] = "measure"
     atom_ids: list[int] = Field(..., min_length=1, description="Atoms to measure")
     start_time: float = Field(..., ge=0, description="Measurement start time in ns")
@@ -478,6 +715,8 @@ class ShieldingEvent(BaseModel):
     that shifts Rydberg levels via Autler-Townes effect, protecting
     atoms from scattered Rydberg light during loading/readout phases.
     """
+    model_config = ConfigDict(frozen=True)
+    
     op_type: Literal["shielding"] = "shielding"
     start_time: float = Field(..., ge=0, description="Start time in ns")
     duration: float = Field(..., gt=0, description="Shielding duration in ns")
@@ -502,6 +741,8 @@ class ReloadOperation(BaseModel):
     This operation models the "replenishment cycle" that enables
     arbitrarily long quantum computations without qubit exhaustion.
     """
+    model_config = ConfigDict(frozen=True)
+    
     op_type: Literal["reload"] = "reload"
     start_time: float = Field(..., ge=0, description="Start time in ns")
     
@@ -624,12 +865,53 @@ class SimulationConfig(BaseModel):
     compute_correlations: bool = Field(default=False, description="Compute two-point correlators")
 
 
+def _operation_duration(op: NeutralAtomOperation) -> float:
+    """Duration of an operation in ns (0 for instantaneous operations)."""
+    fields = type(op).model_fields
+    if 'duration' in fields:
+        return op.duration
+    if 'omega' in fields:
+        return op.omega.duration
+    if 'detuning' in fields and op.detuning:
+        return op.detuning.duration
+    return 0.0
+
+
+def _referenced_atom_ids(op: NeutralAtomOperation) -> list[int]:
+    """Atom IDs an operation refers to (unset optional lists are skipped)."""
+    fields = type(op).model_fields
+    ids: list[int] = []
+    for name in ('target_atoms', 'atom_ids'):
+        if name in fields and getattr(op, name) is not None:
+            ids.extend(getattr(op, name))
+    for name in ('control_atom', 'target_atom'):
+        if name in fields:
+            ids.append(getattr(op, name))
+    return ids
+
+
+@dataclass(frozen=True, eq=False)
+class OperationTimeline:
+    """
+    Operations sorted by start_time (stable), as parallel arrays.
+    
+    eq=False keeps comparison by identity, so a cached timeline never takes
+    part in job equality.
+    """
+    order: np.ndarray   # (m,) int64 indices into `operations`
+    starts: np.ndarray  # (m,) float64 start times in ns, ascending
+    ends: np.ndarray    # (m,) float64 end times in ns, same order
+
+
 class NeutralAtomJob(BaseModel):
     """
     Complete job specification for neutral atom quantum processor.
     
     This is the top-level JSON IR that the Quantum Middle Layer accepts
     for neutral atom backends.
+    
+    `timeline` sorts the operations by start time once and is cached until
+    `operations` is reassigned.
     """
     # Metadata
     job_id: Optional[str] = Field(default=None, description="Unique job identifier")
@@ -651,43 +933,55 @@ class NeutralAtomJob(BaseModel):
     @model_validator(mode='after')
     def validate_operation_atoms_exist(self) -> 'NeutralAtomJob':
         """Ensure all referenced atom IDs exist in the register."""
-        valid_ids = {a.id for a in self.register.atoms}
+        valid_ids = set(self.register.ids.tolist())
+        referenced = [_referenced_atom_ids(op) for op in self.operations]
         
-        for op in self.operations:
-            referenced_ids = set()
-            
-            if hasattr(op, 'target_atoms'):
-                referenced_ids.update(op.target_atoms)
-            if hasattr(op, 'atom_ids'):
-                referenced_ids.update(op.atom_ids)
-            if hasattr(op, 'control_atom'):
-                referenced_ids.add(op.control_atom)
-            if hasattr(op, 'target_atom'):
-                referenced_ids.add(op.target_atom)
-                
-            invalid = referenced_ids - valid_ids
-            if invalid:
-                raise ValueError(f"Operation references non-existent atom IDs: {invalid}")
+        # One bulk membership test; only a failing job is walked per operation
+        # to report the offending IDs
+        if not valid_ids.issuperset(chain.from_iterable(referenced)):
+            for referenced_ids in referenced:
+                invalid = set(referenced_ids) - valid_ids
+                if invalid:
+                    raise ValueError(f"Operation references non-existent atom IDs: {invalid}")
         
         return self
     
+    @cached_property
+    def timeline(self) -> OperationTimeline:
+        """Operations sorted by start_time, with start/end times as arrays."""
+        ops = self.operations
+        starts = np.fromiter((op.start_time for op in ops), dtype=np.float64, count=len(ops))
+        ends = starts + np.fromiter(
+            (_operation_duration(op) for op in ops), dtype=np.float64, count=len(ops)
+        )
+        order = np.argsort(starts, kind='stable')
+        readonly = NeutralAtomRegister._readonly
+        return OperationTimeline(
+            order=readonly(order),
+            starts=readonly(starts[order]),
+            ends=readonly(ends[order]),
+        )
+    
+    @property
+    def operations_by_start(self) -> list[NeutralAtomOperation]:
+        """Operations in start_time order (ties keep their original order)."""
+        ops = self.operations
+        return [ops[k] for k in self.timeline.order.tolist()]
+    
     def get_total_duration(self) -> float:
         """Calculate total sequence duration in ns."""
-        max_end = 0.0
-        for op in self.operations:
-            start = op.start_time
-            duration = 0.0
-            
-            if hasattr(op, 'duration'):
-                duration = op.duration
-            elif hasattr(op, 'omega'):
-                duration = op.omega.duration
-            elif hasattr(op, 'detuning') and op.detuning:
-                duration = op.detuning.duration
-                
-            max_end = max(max_end, start + duration)
-        
-        return max_end
+        return float(self.timeline.ends.max(initial=0.0))
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == 'operations':
+            self.__dict__.pop('timeline', None)
+    
+    def model_copy(self, *, update: Optional[dict[str, Any]] = None, deep: bool = False) -> 'NeutralAtomJob':
+        copy = super().model_copy(update=update, deep=deep)
+        if update and 'operations' in update:
+            copy.__dict__.pop('timeline', None)
+        return copy
 
 
 # =============================================================================
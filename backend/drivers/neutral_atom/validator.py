@@ -17,17 +17,35 @@ References:
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Optional
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Optional
 import math
 
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+    from scipy.spatial.distance import pdist
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from .schema import (
     NeutralAtomJob,
     NeutralAtomRegister,
-    AtomPosition,
     TrapRole,
+    LayoutType,
     ZoneType,
-    ZoneDefinition,
+    TRAP_ROLE_CODES,
+    ZONE_TYPE_CODES,
     ShuttleMove,
     RydbergGate,
     GlobalPulse,
@@ -103,7 +121,13 @@ class ValidationWarning:
 
 @dataclass
 class ValidationResult:
-    """Complete validation result with errors and warnings."""
+    """
+    Complete validation result with errors and warnings.
+    
+    `errors_by_type` buckets the errors by their exact class and
+    `warnings_by_code` the warnings by code when the result is built; use
+    get() and warnings_with_code() instead of filtering the flat lists.
+    """
     is_valid: bool
     errors: list[PhysicsConstraintError]
     warnings: list[ValidationWarning]
@@ -112,12 +136,402 @@ class ValidationResult:
     estimated_decoherence_cost: float = 0.0  # Relative cost from movements
     total_movement_distance: float = 0.0  # Total AOD travel in µm
     
+    # Layout fast path that replaced the register pair search, if any
+    specialization_used: Optional[str] = None
+    
+    errors_by_type: dict[type, list[PhysicsConstraintError]] = field(
+        init=False, repr=False, compare=False
+    )
+    warnings_by_code: dict[str, list[ValidationWarning]] = field(
+        init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self) -> None:
+        buckets: defaultdict[type, list[PhysicsConstraintError]] = defaultdict(list)
+        for error in self.errors:
+            buckets[type(error)].append(error)
+        self.errors_by_type = dict(buckets)
+        
+        by_code: defaultdict[str, list[ValidationWarning]] = defaultdict(list)
+        for warning in self.warnings:
+            by_code[warning.code].append(warning)
+        self.warnings_by_code = dict(by_code)
+    
+    def get(self, error_type: type) -> list[PhysicsConstraintError]:
+        """Errors that are instances of error_type, in validation order."""
+        if all(t is error_type or not issubclass(t, error_type) for t in self.errors_by_type):
+            return list(self.errors_by_type.get(error_type, ()))
+        return [e for e in self.errors if isinstance(e, error_type)]
+    
+    def warnings_with_code(self, code: str) -> list[ValidationWarning]:
+        """Warnings with the given code, in validation order."""
+        return list(self.warnings_by_code.get(code, ()))
+    
     def raise_if_invalid(self) -> None:
         """Raise the first error if validation failed."""
         if not self.is_valid and self.errors:
             raise self.errors[0]
 
 
+# =============================================================================
+# GEOMETRY HELPERS
+# =============================================================================
+
+# Pair search strategy by register size: dense distance matrix below
+# PDIST_MIN_ATOMS, condensed pdist up to KDTREE_MIN_ATOMS, k-d tree above
+# (registers are capped at 256 atoms; crossover measured on lattices)
+PDIST_MIN_ATOMS = 32
+KDTREE_MIN_ATOMS = 192
+
+
+# Relative padding on squared thresholds: squared comparisons only select
+# candidates, and the exact `dist < threshold` test runs on those alone
+SQ_THRESHOLD_MARGIN = 1 + 1e-9
+
+
+def _pairwise_sq_distances(xy: np.ndarray) -> np.ndarray:
+    """Squared Euclidean distance matrix for an (n, 2) array of positions."""
+    diff = xy[:, None, :] - xy[None, :, :]
+    return np.einsum('ijk,ijk->ij', diff, diff)
+
+
+def _pdist_to_ij(k: np.ndarray, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Map condensed pdist indices back to (i, j) pairs with i < j."""
+    i = (n - 2 - np.floor(np.sqrt(-8 * k + 4 * n * (n - 1) - 7) / 2.0 - 0.5)).astype(np.intp)
+    j = (k + i + 1 - n * (n - 1) // 2 + (n - i) * ((n - i) - 1) // 2).astype(np.intp)
+    return i, j
+
+
+def _close_pairs(
+    xy: np.ndarray,
+    threshold: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find all position pairs closer than threshold.
+    
+    Returns index arrays (i, j) with i < j and the pair distances, sorted
+    row-major like a nested `for i: for j > i` loop. Mid-size registers use
+    the condensed (upper-triangle) pdist vector; large registers use a k-d
+    tree range query (O(n log n)) instead of any O(n²) distance table.
+    """
+    n = len(xy)
+    if SCIPY_AVAILABLE and n >= KDTREE_MIN_ATOMS:
+        pairs = cKDTree(xy).query_pairs(r=threshold, output_type='ndarray')
+        i, j = pairs[:, 0], pairs[:, 1]
+        diff = xy[i] - xy[j]
+        dist = np.sqrt(np.einsum('ij,ij->i', diff, diff))
+        keep = dist < threshold  # query_pairs also returns pairs at exactly r
+        i, j, dist = i[keep], j[keep], dist[keep]
+        order = np.lexsort((j, i))
+        return i[order], j[order], dist[order]
+    
+    # Compare squared distances; take square roots of the candidates only
+    sq_threshold = threshold * threshold * SQ_THRESHOLD_MARGIN
+    if SCIPY_AVAILABLE and n >= PDIST_MIN_ATOMS:
+        condensed = pdist(xy, 'sqeuclidean')
+        k = np.flatnonzero(condensed < sq_threshold)  # already row-major
+        i, j = _pdist_to_ij(k, n)
+        dist = np.sqrt(condensed[k])
+    else:
+        sq_dists = _pairwise_sq_distances(xy)
+        i, j = np.nonzero(np.triu(sq_dists < sq_threshold, k=1))
+        dist = np.sqrt(sq_dists[i, j])
+    keep = dist < threshold
+    return i[keep], j[keep], dist[keep]
+
+
+# Absolute tolerance (µm) for an atom to count as sitting on a lattice site
+LATTICE_SITE_TOL = 1e-9
+
+
+def _lattice_min_spacing(
+    xy: np.ndarray,
+    row_pitch: float,
+    col_pitch: float,
+    row_shift: float
+) -> float:
+    """
+    Lower bound on the closest-pair distance if every position sits on a
+    distinct site of the lattice through xy[0] with the given pitches
+    (row_shift: x offset per row, as a fraction of col_pitch); 0.0 otherwise.
+    """
+    rel = xy - xy[0]
+    rows = np.rint(rel[:, 1] / row_pitch) if math.isfinite(row_pitch) else np.zeros(len(xy))
+    x = rel[:, 0] - rows * row_shift * col_pitch
+    cols = np.rint(x / col_pitch) if math.isfinite(col_pitch) else np.zeros(len(xy))
+    off_y = np.abs(rel[:, 1] - rows * row_pitch) if math.isfinite(row_pitch) else np.abs(rel[:, 1])
+    off_x = np.abs(x - cols * col_pitch) if math.isfinite(col_pitch) else np.abs(x)
+    if max(off_x.max(), off_y.max()) > LATTICE_SITE_TOL:
+        return 0.0
+    if len(np.unique(np.column_stack((rows, cols)), axis=0)) != len(xy):
+        return 0.0
+    # Triangular: nearest neighbours are col_pitch apart, in-row and across
+    # rows; rectangular: the smaller of the two pitches
+    spacing = col_pitch if row_shift else min(row_pitch, col_pitch)
+    return spacing - 4 * LATTICE_SITE_TOL
+
+
+def _smallest_step(values: np.ndarray) -> float:
+    """Smallest gap between distinct values (inf if all equal)."""
+    steps = np.diff(np.unique(values))
+    return float(steps.min()) if len(steps) else math.inf
+
+
+def _rectangular_min_spacing(xy: np.ndarray) -> float:
+    """Closest-pair lower bound for a rectangular lattice register, or 0.0."""
+    return _lattice_min_spacing(xy, _smallest_step(xy[:, 1]), _smallest_step(xy[:, 0]), 0.0)
+
+
+def _triangular_min_spacing(xy: np.ndarray) -> float:
+    """
+    Closest-pair lower bound for a triangular lattice register, or 0.0.
+    
+    Rows are sqrt(3)/2 * spacing apart and every other row is shifted by
+    half a spacing; a single row is checked as a rectangular lattice.
+    """
+    row_pitch = _smallest_step(xy[:, 1])
+    if not math.isfinite(row_pitch):
+        return _rectangular_min_spacing(xy)
+    spacing = row_pitch * 2.0 / math.sqrt(3.0)
+    return _lattice_min_spacing(xy, row_pitch, spacing, 0.5)
+
+
+def _zone_indices(zone_bounds: np.ndarray, xy: np.ndarray) -> np.ndarray:
+    """
+    Index of the first zone containing each position, or -1 if none.
+    
+    Same first-match rule as NeutralAtomRegister.get_zone_at_position,
+    evaluated as one (n_positions, n_zones) containment matrix from
+    (n_zones, 4) [x_min, x_max, y_min, y_max] bounds.
+    """
+    x = xy[:, 0, None]
+    y = xy[:, 1, None]
+    inside = (
+        (x >= zone_bounds[:, 0]) & (x <= zone_bounds[:, 1])
+        & (y >= zone_bounds[:, 2]) & (y <= zone_bounds[:, 3])
+    )
+    return np.where(inside.any(axis=1), inside.argmax(axis=1), -1)
+
+
+def _zone_flags(flags) -> np.ndarray:
+    """Per-zone boolean lookup with a trailing False so index -1 means 'no zone'."""
+    return np.append(np.asarray(flags, dtype=bool), False)
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _count_close_pairs_batch(xy, offsets, thresholds):
+        """Close-pair count per register; registers are CSR slices of xy."""
+        num_jobs = offsets.shape[0] - 1
+        counts = np.zeros(num_jobs, dtype=np.int64)
+        for b in prange(num_jobs):
+            lo = offsets[b]
+            hi = offsets[b + 1]
+            limit = thresholds[b] * thresholds[b]
+            count = 0
+            for i in range(lo, hi):
+                for j in range(i + 1, hi):
+                    dx = xy[i, 0] - xy[j, 0]
+                    dy = xy[i, 1] - xy[j, 1]
+                    if dx * dx + dy * dy < limit:
+                        count += 1
+            counts[b] = count
+        return counts
+
+
+def _check_crossings_py(
+    start_xy: np.ndarray,
+    end_xy: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray
+) -> np.ndarray:
+    """NumPy version of _check_crossings."""
+    n = len(start_xy)
+    out = np.empty((2, n, n), dtype=bool)
+    for k, (labels, axis) in enumerate(((rows, 1), (cols, 0))):
+        start_sign = np.sign(start_xy[:, None, axis] - start_xy[None, :, axis])
+        end_sign = np.sign(end_xy[:, None, axis] - end_xy[None, :, axis])
+        out[k] = (labels[:, None] != labels[None, :]) & (start_sign * end_sign < 0)
+    return out
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _check_crossings(start_xy, end_xy, rows, cols):
+        """
+        Pairwise AOD crossing mask of shape (2, n, n): [0] row, [1] column.
+        
+        A pair crosses when the atoms sit in different AOD rows (columns)
+        and their y (x) order strictly flips between start and end.
+        """
+        n = start_xy.shape[0]
+        out = np.zeros((2, n, n), dtype=np.bool_)
+        for i in prange(n):
+            for j in range(n):
+                if rows[i] != rows[j]:
+                    if (np.sign(start_xy[i, 1] - start_xy[j, 1])
+                            * np.sign(end_xy[i, 1] - end_xy[j, 1]) < 0):
+                        out[0, i, j] = True
+                if cols[i] != cols[j]:
+                    if (np.sign(start_xy[i, 0] - start_xy[j, 0])
+                            * np.sign(end_xy[i, 0] - end_xy[j, 0]) < 0):
+                        out[1, i, j] = True
+        return out
+else:
+    _check_crossings = _check_crossings_py
+
+
+def _overlap_pairs_py(
+    starts: np.ndarray,
+    ends: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """NumPy version of _overlap_pairs."""
+    n = len(starts)
+    order = np.argsort(starts, kind='stable')
+    hi = np.searchsorted(starts[order], ends[order], side='left')
+    counts = np.maximum(hi - np.arange(n) - 1, 0)
+    first = np.repeat(np.arange(n), counts)
+    second = first + 1 + (np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts))
+    a = order[first]
+    b = order[second]
+    keys = np.sort(np.minimum(a, b) * n + np.maximum(a, b))
+    return keys // n, keys % n
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _overlap_pairs(starts, ends):
+        """
+        All overlapping pairs (i, j), i < j, of half-open [start, end)
+        intervals, sorted by (i, j).
+        
+        Sort by start once; interval p then overlaps exactly the
+        later-starting intervals that begin before it ends, a contiguous run
+        bounded by searchsorted, so the work is O(n log n + pairs).
+        """
+        n = starts.shape[0]
+        order = np.argsort(starts, kind='mergesort')
+        sorted_starts = starts[order]
+        hi = np.empty(n, dtype=np.int64)
+        total = 0
+        for p in range(n):
+            hi[p] = np.searchsorted(sorted_starts, ends[order[p]])
+            if hi[p] > p + 1:
+                total += hi[p] - p - 1
+        keys = np.empty(total, dtype=np.int64)
+        k = 0
+        for p in range(n):
+            for q in range(p + 1, hi[p]):
+                a = order[p]
+                b = order[q]
+                keys[k] = a * n + b if a < b else b * n + a
+                k += 1
+        keys.sort()
+        return keys // n, keys % n
+else:
+    _overlap_pairs = _overlap_pairs_py
+
+
+def _shuttle_paths(
+    sources: list[tuple[float, float]],
+    targets: list[tuple[float, float]]
+) -> np.ndarray:
+    """
+    Per-atom [x0, y0, x1, y1] segments of a shuttle, as a (k, 4) array.
+    Every supported trajectory moves each atom along the straight segment
+    between its start and target positions.
+    """
+    return np.hstack((
+        np.array(sources, dtype=np.float64).reshape(-1, 2),
+        np.array(targets, dtype=np.float64).reshape(-1, 2),
+    ))
+
+
+def _shuttle_bbox(paths: np.ndarray) -> tuple[float, float, float, float]:
+    """Axis-aligned box [x_min, x_max, y_min, y_max] covering a shuttle's segments."""
+    xs = paths[:, 0::2]
+    ys = paths[:, 1::2]
+    return (float(xs.min()), float(xs.max()), float(ys.min()), float(ys.max()))
+
+
+def _boxes_intersect(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Row-wise closed intersection test of (k, 4) [x_min, x_max, y_min, y_max] boxes."""
+    return (
+        (a[:, 0] <= b[:, 1]) & (b[:, 0] <= a[:, 1])
+        & (a[:, 2] <= b[:, 3]) & (b[:, 2] <= a[:, 3])
+    )
+
+
+def _segments_intersect(p: np.ndarray, q: np.ndarray) -> bool:
+    """
+    Whether any segment of p (m, 4) meets any segment of q (n, 4), touching
+    and collinear overlap included. Degenerate (point) segments are handled.
+    """
+    p1, p2 = p[:, None, 0:2], p[:, None, 2:4]
+    q1, q2 = q[None, :, 0:2], q[None, :, 2:4]
+    
+    def orient(a, b, c):
+        return ((b[..., 0] - a[..., 0]) * (c[..., 1] - a[..., 1])
+                - (b[..., 1] - a[..., 1]) * (c[..., 0] - a[..., 0]))
+    
+    # Endpoints of each segment on opposite sides of (or on) the other's line
+    straddle = (
+        (orient(p1, p2, q1) * orient(p1, p2, q2) <= 0)
+        & (orient(q1, q2, p1) * orient(q1, q2, p2) <= 0)
+    )
+    # Per-pair box overlap settles the collinear (all-zero) case
+    overlap = (
+        (np.minimum(p1[..., 0], p2[..., 0]) <= np.maximum(q1[..., 0], q2[..., 0]))
+        & (np.minimum(q1[..., 0], q2[..., 0]) <= np.maximum(p1[..., 0], p2[..., 0]))
+        & (np.minimum(p1[..., 1], p2[..., 1]) <= np.maximum(q1[..., 1], q2[..., 1]))
+        & (np.minimum(q1[..., 1], q2[..., 1]) <= np.maximum(p1[..., 1], p2[..., 1]))
+    )
+    return bool((straddle & overlap).any())
+
+
+def _registers_with_close_pairs(jobs: list[NeutralAtomJob]) -> list[bool]:
+    """
+    Screen a batch of registers for atoms within the near-collision warning
+    distance, one parallel kernel call for the whole batch.
+    
+    Without numba every register is reported as needing the full pair
+    search. The threshold is padded slightly so rounding can only produce
+    false positives, never skip a real pair.
+    """
+    if not NUMBA_AVAILABLE or not jobs:
+        return [True] * len(jobs)
+    
+    xy = np.concatenate([job.register.xy for job in jobs])
+    offsets = np.zeros(len(jobs) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(job.register.atoms) for job in jobs])
+    thresholds = np.array(
+        [job.register.min_atom_distance * 1.1 * SQ_THRESHOLD_MARGIN for job in jobs],
+        dtype=np.float64
+    )
+    return (_count_close_pairs_batch(xy, offsets, thresholds) > 0).tolist()
+
+
+def _warmup() -> None:
+    """Compile (or load from cache) the numba kernels at import."""
+    if not NUMBA_AVAILABLE:
+        return
+    _count_close_pairs_batch(
+        np.zeros((1, 2), dtype=np.float64),
+        np.array([0, 1], dtype=np.int64),
+        np.ones(1, dtype=np.float64),
+    )
+    _check_crossings(
+        np.zeros((1, 2), dtype=np.float64),
+        np.zeros((1, 2), dtype=np.float64),
+        np.zeros(1, dtype=np.int32),
+        np.zeros(1, dtype=np.int32),
+    )
+    _overlap_pairs(np.zeros(1, dtype=np.float64), np.ones(1, dtype=np.float64))
+
+
+_warmup()
+
+
 # =============================================================================
 # PULSER VALIDATOR
 # =============================================================================
@@ -141,6 +555,24 @@ class PulserValidator:
     # Heating model parameters
     HEATING_COEFFICIENT = 0.01  # Decoherence cost per (µm * velocity_ratio)
     
+    # Closed-form closest-pair bounds for fixed layouts (0.0 when the atoms
+    # are not actually on the lattice); other layouts use the pair search
+    _layout_specializers: dict[LayoutType, Callable[[np.ndarray], float]] = {
+        LayoutType.RECTANGULAR: _rectangular_min_spacing,
+        LayoutType.TRIANGULAR: _triangular_min_spacing,
+    }
+    
+    # Per-operation validators keyed by operation class (subclasses resolve
+    # through their MRO), looked up by name so validator subclasses can
+    # override them. Every handler returns (errors, warnings, movement,
+    # decoherence); operation types not listed need no checks.
+    _operation_handlers: dict[type, str] = {
+        ShuttleMove: '_validate_shuttle',
+        RydbergGate: '_validate_rydberg_gate',
+        GlobalPulse: '_validate_global_pulse_zones',
+        Measurement: '_validate_measurement_zones',
+    }
+    
     def __init__(
         self,
         max_aod_velocity: float = DEFAULT_MAX_AOD_VELOCITY,
@@ -169,13 +601,53 @@ class PulserValidator:
         Returns:
             ValidationResult with errors, warnings, and metrics
         """
+        return self._validate_job(job)
+    
+    def validate_jobs(self, jobs: list[NeutralAtomJob]) -> list[ValidationResult]:
+        """
+        Validate a batch of jobs.
+        
+        The O(n²) register proximity scan runs for all jobs at once (in
+        parallel with numba); registers without close pairs then skip the
+        per-job pair search. Results match calling validate() on each job.
+        
+        Args:
+            jobs: NeutralAtomJobs to validate
+            
+        Returns:
+            One ValidationResult per job, in input order
+        """
+        screened = _registers_with_close_pairs(jobs)
+        return [
+            self._validate_job(job, has_close_pairs=flag)
+            for job, flag in zip(jobs, screened)
+        ]
+    
+    def _validate_job(
+        self,
+        job: NeutralAtomJob,
+        has_close_pairs: bool = True
+    ) -> ValidationResult:
+        """Validation body shared by validate() and validate_jobs()."""
         errors: list[PhysicsConstraintError] = []
         warnings: list[ValidationWarning] = []
         total_movement = 0.0
         decoherence_cost = 0.0
         
+        # 0. Fixed layouts whose lattice spacing already clears the
+        # near-collision distance need no pair search at all
+        specialization = None
+        specializer = self._layout_specializers.get(job.register.layout_type)
+        if has_close_pairs and specializer is not None:
+            warn_dist = job.register.min_atom_distance * 1.1
+            if specializer(job.register.xy) >= warn_dist * SQ_THRESHOLD_MARGIN:
+                has_close_pairs = False
+                specialization = job.register.layout_type.value
+        
         # 1. Validate initial register geometry
-        geom_errors, geom_warnings = self._validate_register_geometry(job.register)
+        geom_errors, geom_warnings = self._validate_register_geometry(
+            job.register, has_close_pairs
+        )
         errors.extend(geom_errors)
         warnings.extend(geom_warnings)
         
@@ -184,6 +656,9 @@ class PulserValidator:
             a.id: (a.x, a.y) for a in job.register.atoms
         }
         
+        # Per-atom [x0, y0, x1, y1] segments swept by each shuttle
+        shuttle_paths: dict[int, np.ndarray] = {}
+        
         for i, op in enumerate(job.operations):
             op_errors, op_warnings, movement, cost = self._validate_operation(
                 op, job.register, current_positions, i
@@ -195,11 +670,15 @@ class PulserValidator:
             
             # Update positions if this was a shuttle move
             if isinstance(op, ShuttleMove):
+                shuttle_paths[i] = _shuttle_paths(
+                    [current_positions.get(atom_id, (0.0, 0.0)) for atom_id in op.atom_ids],
+                    op.target_positions
+                )
                 for atom_id, target_pos in zip(op.atom_ids, op.target_positions):
                     current_positions[atom_id] = target_pos
         
         # 3. Check for temporal overlaps (concurrent operations)
-        overlap_warnings = self._check_temporal_overlaps(job.operations)
+        overlap_warnings = self._check_temporal_overlaps(job.operations, shuttle_paths)
         warnings.extend(overlap_warnings)
         
         return ValidationResult(
@@ -207,49 +686,114 @@ class PulserValidator:
             errors=errors,
             warnings=warnings,
             estimated_decoherence_cost=decoherence_cost,
-            total_movement_distance=total_movement
+            total_movement_distance=total_movement,
+            specialization_used=specialization
         )
     
     def _validate_register_geometry(
         self, 
-        register: NeutralAtomRegister
+        register: NeutralAtomRegister,
+        has_close_pairs: bool = True
     ) -> tuple[list[PhysicsConstraintError], list[ValidationWarning]]:
-        """Validate initial atom positions."""
-        errors = []
-        warnings = []
+        """
+        Validate initial atom positions.
         
-        atoms = register.atoms
-        min_dist = register.min_atom_distance
+        Findings depend on the register alone and are memoized on its
+        geometry; has_close_pairs=False (from the batch screen)
+        skips the pair search.
+        """
+        if has_close_pairs:
+            error_msgs, warning_specs = self._cached_register_check(
+                register.xy.tobytes(),
+                np.concatenate((
+                    register.ids, register.roles_arr,
+                    register.aod_rows, register.aod_cols,
+                )).astype(np.int64).tobytes(),
+                register.min_atom_distance,
+            )
+        else:
+            error_msgs, warning_specs = self._register_findings(
+                register.xy, register.ids, register.roles_arr,
+                register.aod_rows, register.aod_cols,
+                register.min_atom_distance, has_close_pairs=False
+            )
         
-        # Check all pairwise distances
-        for i, a1 in enumerate(atoms):
-            for a2 in atoms[i+1:]:
-                dist = math.sqrt((a1.x - a2.x)**2 + (a1.y - a2.y)**2)
-                
-                if dist < min_dist:
-                    errors.append(CollisionError(
-                        f"Atoms {a1.id} and {a2.id} are too close: "
-                        f"{dist:.2f} µm < {min_dist} µm minimum"
-                    ))
-                elif dist < min_dist * 1.1:
-                    # Very close but technically valid
-                    warnings.append(ValidationWarning(
-                        code="NEAR_COLLISION",
-                        message=f"Atoms {a1.id} and {a2.id} are very close ({dist:.2f} µm)",
-                        severity="medium"
-                    ))
+        # Fresh objects per call: cached findings are shared between results
+        errors = [CollisionError(msg) for msg in error_msgs]
+        warnings = [
+            ValidationWarning(code=code, message=msg, severity=severity)
+            for code, msg, severity in warning_specs
+        ]
+        return errors, warnings
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _cached_register_check(
+        xy_bytes: bytes,
+        meta_bytes: bytes,
+        min_dist: float
+    ) -> tuple[tuple[str, ...], tuple[tuple[str, str, str], ...]]:
+        """
+        Memoized register findings, keyed by the raw geometry bytes.
         
-        # Check AOD atoms have row/col assignments
-        aod_atoms = [a for a in atoms if a.role == TrapRole.AOD]
-        for a in aod_atoms:
-            if a.aod_row is None or a.aod_col is None:
-                warnings.append(ValidationWarning(
-                    code="MISSING_AOD_GRID",
-                    message=f"AOD atom {a.id} missing aod_row/aod_col for topological checks",
-                    severity="high"
+        The bytes are the whole key, so equal keys mean equal registers;
+        meta_bytes holds ids, roles, AOD rows and AOD columns as stacked
+        int64.
+        """
+        xy = np.frombuffer(xy_bytes, dtype=np.float64).reshape(-1, 2)
+        ids, roles, aod_rows, aod_cols = np.frombuffer(meta_bytes, dtype=np.int64).reshape(4, -1)
+        return PulserValidator._register_findings(
+            xy, ids, roles, aod_rows, aod_cols, min_dist, has_close_pairs=True
+        )
+    
+    @staticmethod
+    def _register_findings(
+        xy: np.ndarray,
+        ids: np.ndarray,
+        roles: np.ndarray,
+        aod_rows: np.ndarray,
+        aod_cols: np.ndarray,
+        min_dist: float,
+        has_close_pairs: bool
+    ) -> tuple[tuple[str, ...], tuple[tuple[str, str, str], ...]]:
+        """Register-only checks as (error messages, (code, message, severity))."""
+        errors = []
+        warnings = []
+        
+        # Check all pairwise distances at once; only pairs below the warning
+        # threshold are visited in Python
+        if has_close_pairs:
+            close_i, close_j, close_dist = _close_pairs(xy, min_dist * 1.1)
+        else:
+            close_i = close_j = close_dist = np.empty(0)
+        for i, j, dist in zip(close_i.tolist(), close_j.tolist(), close_dist.tolist()):
+            id1, id2 = int(ids[i]), int(ids[j])
+            
+            if dist < min_dist:
+                errors.append(
+                    f"Atoms {id1} and {id2} are too close: "
+                    f"{dist:.2f} µm < {min_dist} µm minimum"
+                )
+            else:
+                # Very close but technically valid
+                warnings.append((
+                    "NEAR_COLLISION",
+                    f"Atoms {id1} and {id2} are very close ({dist:.2f} µm)",
+                    "medium"
                 ))
         
-        return errors, warnings
+        # Check AOD atoms have row/col assignments (-1 marks a missing one)
+        missing_grid = (roles == TRAP_ROLE_CODES[TrapRole.AOD]) & (
+            (aod_rows < 0) | (aod_cols < 0)
+        )
+        for i in np.flatnonzero(missing_grid).tolist():
+            warnings.append((
+                "MISSING_AOD_GRID",
+                f"AOD atom {int(ids[i])} missing aod_row/aod_col for topological checks",
+                "high"
+            ))
+        
+        return tuple(errors), tuple(warnings)
     
     def _validate_operation(
         self,
@@ -259,42 +803,13 @@ class PulserValidator:
         op_index: int
     ) -> tuple[list[PhysicsConstraintError], list[ValidationWarning], float, float]:
         """Validate a single operation."""
-        errors = []
-        warnings = []
-        movement = 0.0
-        decoherence = 0.0
-        
-        if isinstance(op, ShuttleMove):
-            errs, warns, mov, dec = self._validate_shuttle(
-                op, register, current_positions, op_index
-            )
-            errors.extend(errs)
-            warnings.extend(warns)
-            movement = mov
-            decoherence = dec
-            
-        elif isinstance(op, RydbergGate):
-            errs, warns = self._validate_rydberg_gate(
-                op, register, current_positions, op_index
-            )
-            errors.extend(errs)
-            warnings.extend(warns)
-        
-        elif isinstance(op, GlobalPulse):
-            errs, warns = self._validate_global_pulse_zones(
-                op, register, current_positions, op_index
-            )
-            errors.extend(errs)
-            warnings.extend(warns)
-        
-        elif isinstance(op, Measurement):
-            errs, warns = self._validate_measurement_zones(
-                op, register, current_positions, op_index
-            )
-            errors.extend(errs)
-            warnings.extend(warns)
-        
-        return errors, warnings, movement, decoherence
+        handlers = self._operation_handlers
+        name = handlers.get(type(op))
+        if name is None:
+            name = next((handlers[cls] for cls in type(op).__mro__ if cls in handlers), None)
+            if name is None:
+                return [], [], 0.0, 0.0
+        return getattr(self, name)(op, register, current_positions, op_index)
     
     def _validate_shuttle(
         self,
@@ -314,33 +829,48 @@ class PulserValidator:
         """
         errors = []
         warnings = []
-        total_movement = 0.0
-        decoherence_cost = 0.0
         
         # Get AOD atom info
         aod_atoms = {a.id: a for a in register.atoms if a.role == TrapRole.AOD}
+        is_aod = np.array([atom_id in aod_atoms for atom_id in op.atom_ids], dtype=bool)
         
-        for i, atom_id in enumerate(op.atom_ids):
+        # Distances, velocities and heating for every moved atom in one pass
+        starts = np.array(
+            [current_positions[atom_id] if ok else (0.0, 0.0)
+             for atom_id, ok in zip(op.atom_ids, is_aod)],
+            dtype=np.float64
+        ).reshape(-1, 2)
+        targets = np.asarray(op.target_positions, dtype=np.float64).reshape(-1, 2)
+        diff = targets - starts
+        dists = np.where(is_aod, np.sqrt(diff[:, 0]**2 + diff[:, 1]**2), 0.0)
+        
+        # Calculate velocity (convert ns to µs)
+        duration_us = op.duration / 1000.0
+        velocities = dists / duration_us
+        delta_nvibs = HeatingModel.calculate_nvib_increase(dists, velocities)
+        
+        total_movement = float(dists.sum())
+        # Estimate decoherence from movement
+        decoherence_cost = float(
+            (dists * (velocities / self.max_aod_velocity) * self.HEATING_COEFFICIENT).sum()
+        )
+        
+        # Only atoms that trigger a diagnostic are visited in Python. Loss
+        # risk needs n_vib above the loss threshold (18), so it is covered
+        # by the heating warning threshold.
+        flagged = ~is_aod | (velocities > self.max_aod_velocity * 0.8) | (delta_nvibs > 10.0)
+        
+        for i in np.flatnonzero(flagged).tolist():
+            atom_id = op.atom_ids[i]
             # Check if atom is AOD type
-            if atom_id not in aod_atoms:
+            if not is_aod[i]:
                 errors.append(PhysicsConstraintError(
                     f"Atom {atom_id} is not an AOD atom - cannot shuttle SLM atoms"
                 ))
                 continue
             
-            start_pos = current_positions[atom_id]
-            target_pos = op.target_positions[i]
-            
-            # Calculate movement distance
-            dist = math.sqrt(
-                (target_pos[0] - start_pos[0])**2 + 
-                (target_pos[1] - start_pos[1])**2
-            )
-            total_movement += dist
-            
-            # Calculate velocity (convert ns to µs)
-            duration_us = op.duration / 1000.0
-            velocity = dist / duration_us if duration_us > 0 else float('inf')
+            velocity = float(velocities[i])
+            delta_nvib = float(delta_nvibs[i])
             
             if velocity > self.max_aod_velocity:
                 errors.append(VelocityExceededError(
@@ -356,8 +886,7 @@ class PulserValidator:
                     operation_index=op_index
                 ))
             
-            # Calculate vibrational heating (v3.0)
-            delta_nvib = HeatingModel.calculate_nvib_increase(dist, velocity)
+            # Vibrational heating (v3.0)
             if delta_nvib > 18.0:  # Critical threshold
                 fidelity_loss = HeatingModel.estimate_fidelity_loss(delta_nvib)
                 warnings.append(ValidationWarning(
@@ -396,13 +925,9 @@ class PulserValidator:
                     severity="high" if p_loss > 0.1 else "medium",
                     operation_index=op_index
                 ))
-            
-            # Estimate decoherence from movement
-            velocity_ratio = velocity / self.max_aod_velocity
-            decoherence_cost += dist * velocity_ratio * self.HEATING_COEFFICIENT
         
         # Check for topological violations (row/column crossing)
-        topo_error = self._check_topological_constraint(op, register)
+        topo_error = self._check_topological_constraint(op, register, current_positions)
         if topo_error:
             errors.append(topo_error)
         
@@ -412,23 +937,29 @@ class PulserValidator:
             new_positions[atom_id] = target_pos
         
         min_dist = register.min_atom_distance
-        for id1, pos1 in new_positions.items():
-            for id2, pos2 in new_positions.items():
-                if id1 >= id2:
-                    continue
-                dist = math.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
-                if dist < min_dist:
-                    errors.append(CollisionError(
-                        f"Shuttle would cause collision: atoms {id1} and {id2} "
-                        f"would be {dist:.2f} µm apart (min: {min_dist} µm)"
-                    ))
+        ids = list(new_positions)
+        id_arr = np.array(ids)
+        xy = np.array(list(new_positions.values()), dtype=np.float64)
+        hit_i, hit_j, hit_dist = _close_pairs(xy, min_dist)
+        # Report each pair as (lower id, higher id), ordered by position in
+        # new_positions of the lower id, then of the higher id
+        swap = id_arr[hit_i] > id_arr[hit_j]
+        first = np.where(swap, hit_j, hit_i)
+        second = np.where(swap, hit_i, hit_j)
+        order = np.lexsort((second, first))
+        for i, j, dist in zip(first[order].tolist(), second[order].tolist(), hit_dist[order].tolist()):
+            errors.append(CollisionError(
+                f"Shuttle would cause collision: atoms {ids[i]} and {ids[j]} "
+                f"would be {dist:.2f} µm apart (min: {min_dist} µm)"
+            ))
         
         return errors, warnings, total_movement, decoherence_cost
     
     def _check_topological_constraint(
         self,
         op: ShuttleMove,
-        register: NeutralAtomRegister
+        register: NeutralAtomRegister,
+        current_positions: Optional[dict[int, tuple[float, float]]] = None
     ) -> Optional[TopologicalViolationError]:
         """
         Check if AOD movement would require row/column crossing.
@@ -436,48 +967,40 @@ class PulserValidator:
         In a 2D AOD array, atoms in different rows cannot swap their
         relative row order, and same for columns. This is because the
         AOD lattice is controlled by row/column deflectors that cannot
-        cross each other.
+        cross each other. Positions default to the initial register layout
+        when current_positions is not given.
         """
-        aod_atoms = {a.id: a for a in register.atoms if a.role == TrapRole.AOD}
-        
-        # Get atoms with grid info
-        atoms_with_grid = []
-        for atom_id in op.atom_ids:
-            atom = aod_atoms.get(atom_id)
-            if atom and atom.aod_row is not None and atom.aod_col is not None:
-                atoms_with_grid.append(atom)
-        
-        if len(atoms_with_grid) < 2:
+        # AOD atoms with grid info, moved or not: a moving atom may cross a
+        # stationary one
+        grid = np.flatnonzero(
+            (register.roles_arr == TRAP_ROLE_CODES[TrapRole.AOD])
+            & (register.aod_rows >= 0) & (register.aod_cols >= 0)
+        )
+        ids = register.ids[grid].tolist()
+        slot = {atom_id: k for k, atom_id in enumerate(ids)}
+        if len(ids) < 2 or not any(atom_id in slot for atom_id in op.atom_ids):
             return None  # Can't check topology without grid info
         
-        # Build initial row/col ordering
-        initial_row_order = sorted(atoms_with_grid, key=lambda a: a.y)
-        initial_col_order = sorted(atoms_with_grid, key=lambda a: a.x)
-        
-        # Get target positions and check if order would change
-        target_map = dict(zip(op.atom_ids, op.target_positions))
-        
-        def get_target_y(a: AtomPosition) -> float:
-            if a.id in target_map:
-                return target_map[a.id][1]
-            return a.y
-        
-        def get_target_x(a: AtomPosition) -> float:
-            if a.id in target_map:
-                return target_map[a.id][0]
-            return a.x
+        if current_positions is None:
+            start_xy = register.xy[grid]
+        else:
+            start_xy = np.array([current_positions[atom_id] for atom_id in ids], dtype=np.float64)
+        end_xy = start_xy.copy()
+        for atom_id, target_pos in zip(op.atom_ids, op.target_positions):
+            if atom_id in slot:
+                end_xy[slot[atom_id]] = target_pos
         
-        target_row_order = sorted(atoms_with_grid, key=get_target_y)
-        target_col_order = sorted(atoms_with_grid, key=get_target_x)
+        crossings = _check_crossings(
+            start_xy, end_xy, register.aod_rows[grid], register.aod_cols[grid]
+        )
         
-        # Check if ordering changed
-        if [a.id for a in initial_row_order] != [a.id for a in target_row_order]:
+        if crossings[0].any():
             return TopologicalViolationError(
                 "Movement would require AOD row crossing - physically impossible. "
                 "Atoms in different AOD rows cannot swap their vertical order."
             )
         
-        if [a.id for a in initial_col_order] != [a.id for a in target_col_order]:
+        if crossings[1].any():
             return TopologicalViolationError(
                 "Movement would require AOD column crossing - physically impossible. "
                 "Atoms in different AOD columns cannot swap their horizontal order."
@@ -491,7 +1014,7 @@ class PulserValidator:
         register: NeutralAtomRegister,
         current_positions: dict[int, tuple[float, float]],
         op_index: int
-    ) -> tuple[list[PhysicsConstraintError], list[ValidationWarning]]:
+    ) -> tuple[list[PhysicsConstraintError], list[ValidationWarning], float, float]:
         """
         Validate Rydberg two-qubit gate.
         
@@ -505,9 +1028,21 @@ class PulserValidator:
         
         if pos1 is None or pos2 is None:
             # Atom existence already validated by schema
-            return errors, warnings
+            return errors, warnings, 0.0, 0.0
+        
+        # Squared distances (padded by SQ_THRESHOLD_MARGIN) only select
+        # candidates; the exact tests on the distance decide at the limits
+        dx = pos1[0] - pos2[0]
+        dy = pos1[1] - pos2[1]
+        d2 = dx * dx + dy * dy
+        near_edge = d2 * SQ_THRESHOLD_MARGIN > register._blockade_r2 * 0.81  # 0.9 * blockade
+        too_close = d2 < register._min_d2 * SQ_THRESHOLD_MARGIN
+        if not (near_edge or too_close):
+            return errors, warnings, 0.0, 0.0
         
-        dist = math.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
+        # Same expression as the unsquared check: pow() and multiplication
+        # can round differently by an ulp
+        dist = math.sqrt(dx**2 + dy**2)
         blockade = register.blockade_radius
         
         if dist > blockade:
@@ -531,7 +1066,7 @@ class PulserValidator:
                 f"{dist:.2f} µm. Risk of atomic collision."
             ))
         
-        return errors, warnings
+        return errors, warnings, 0.0, 0.0
     
     def _validate_global_pulse_zones(
         self,
@@ -539,7 +1074,7 @@ class PulserValidator:
         register: NeutralAtomRegister,
         current_positions: dict[int, tuple[float, float]],
         op_index: int
-    ) -> tuple[list[PhysicsConstraintError], list[ValidationWarning]]:
+    ) -> tuple[list[PhysicsConstraintError], list[ValidationWarning], float, float]:
         """
         Validate GlobalPulse against zone constraints.
         
@@ -551,29 +1086,31 @@ class PulserValidator:
         
         # If no zones defined, skip zone validation (backward compatible)
         if register.zones is None:
-            return errors, warnings
+            return errors, warnings, 0.0, 0.0
         
         # Check if any atoms are in storage zones
         storage_zones = register.get_zones_by_type(ZoneType.STORAGE)
         if not storage_zones:
-            return errors, warnings
+            return errors, warnings, 0.0, 0.0
         
-        atoms_in_storage = []
-        for atom in register.atoms:
-            pos = current_positions.get(atom.id, (atom.x, atom.y))
-            zone = register.get_zone_at_position(pos[0], pos[1])
-            if zone and zone.zone_type == ZoneType.STORAGE:
-                atoms_in_storage.append(atom.id)
+        zones = register.zones
+        atom_ids = [atom.id for atom in register.atoms]
+        xy = np.array(
+            [current_positions.get(atom.id, (atom.x, atom.y)) for atom in register.atoms],
+            dtype=np.float64
+        ).reshape(-1, 2)
+        zone_idx = _zone_indices(register.zone_bounds, xy)
+        in_storage = _zone_flags(register.zone_types_arr == ZONE_TYPE_CODES[ZoneType.STORAGE])[zone_idx]
+        
+        atoms_in_storage = [atom_ids[k] for k in np.flatnonzero(in_storage)]
         
         if atoms_in_storage:
             # Check if storage zone has shielding
-            shielded_atoms = []
-            for atom_id in atoms_in_storage:
-                pos = current_positions.get(atom_id)
-                if pos:
-                    zone = register.get_zone_at_position(pos[0], pos[1])
-                    if zone and zone.shielding_light:
-                        shielded_atoms.append(atom_id)
+            is_shielded = _zone_flags([z.shielding_light for z in zones])[zone_idx]
+            shielded_atoms = [
+                atom_ids[k] for k in np.flatnonzero(in_storage & is_shielded)
+                if atom_ids[k] in current_positions
+            ]
             
             if shielded_atoms:
                 warnings.append(ValidationWarning(
@@ -590,7 +1127,7 @@ class PulserValidator:
                     operation_index=op_index
                 ))
         
-        return errors, warnings
+        return errors, warnings, 0.0, 0.0
     
     def _validate_measurement_zones(
         self,
@@ -598,7 +1135,7 @@ class PulserValidator:
         register: NeutralAtomRegister,
         current_positions: dict[int, tuple[float, float]],
         op_index: int
-    ) -> tuple[list[PhysicsConstraintError], list[ValidationWarning]]:
+    ) -> tuple[list[PhysicsConstraintError], list[ValidationWarning], float, float]:
         """
         Validate Measurement against zone constraints.
         
@@ -609,20 +1146,20 @@ class PulserValidator:
         
         # If no zones defined, skip zone validation (backward compatible)
         if register.zones is None:
-            return errors, warnings
+            return errors, warnings, 0.0, 0.0
         
         readout_zones = register.get_zones_by_type(ZoneType.READOUT)
         if not readout_zones:
             # No readout zones defined, measurements allowed anywhere
-            return errors, warnings
+            return errors, warnings, 0.0, 0.0
         
-        atoms_outside_readout = []
-        for atom_id in op.atom_ids:
-            pos = current_positions.get(atom_id)
-            if pos:
-                zone = register.get_zone_at_position(pos[0], pos[1])
-                if zone is None or zone.zone_type != ZoneType.READOUT:
-                    atoms_outside_readout.append(atom_id)
+        measured = [atom_id for atom_id in op.atom_ids if current_positions.get(atom_id)]
+        xy = np.array(
+            [current_positions[atom_id] for atom_id in measured], dtype=np.float64
+        ).reshape(-1, 2)
+        zone_idx = _zone_indices(register.zone_bounds, xy)
+        in_readout = _zone_flags(register.zone_types_arr == ZONE_TYPE_CODES[ZoneType.READOUT])[zone_idx]
+        atoms_outside_readout = [measured[k] for k in np.flatnonzero(~in_readout)]
         
         if atoms_outside_readout:
             warnings.append(ValidationWarning(
@@ -632,41 +1169,66 @@ class PulserValidator:
                 operation_index=op_index
             ))
         
-        return errors, warnings
+        return errors, warnings, 0.0, 0.0
     
     def _check_temporal_overlaps(
         self,
-        operations: list[NeutralAtomOperation]
+        operations: list[NeutralAtomOperation],
+        shuttle_paths: Optional[dict[int, np.ndarray]] = None
     ) -> list[ValidationWarning]:
-        """Check for potentially problematic temporal overlaps."""
+        """
+        Check for potentially problematic temporal overlaps.
+        
+        shuttle_paths maps operation index to the (k, 4) atom segments of
+        that shuttle; concurrent shuttles with intersecting segments also get
+        a SPATIAL_SHUTTLE_CROSSING warning. Bounding boxes prefilter the
+        pairs, and the segment test runs only where boxes meet.
+        """
         warnings = []
         
-        # Get time intervals for each operation
-        intervals = []
-        for i, op in enumerate(operations):
-            start = op.start_time
-            duration = 0.0
-            
-            if hasattr(op, 'duration'):
-                duration = op.duration
-            elif hasattr(op, 'omega'):
-                duration = op.omega.duration
-            elif hasattr(op, 'detuning') and op.detuning:
-                duration = op.detuning.duration
-            
-            if duration > 0:
-                intervals.append((start, start + duration, i, type(op).__name__))
-        
-        # Check for overlapping shuttles (dangerous)
-        shuttle_intervals = [(s, e, i, t) for s, e, i, t in intervals if t == "ShuttleMove"]
-        for j, (s1, e1, i1, _) in enumerate(shuttle_intervals):
-            for s2, e2, i2, _ in shuttle_intervals[j+1:]:
-                if s1 < e2 and s2 < e1:  # Overlap
+        # Check for overlapping shuttles (dangerous). Only shuttle intervals
+        # are compared, so other operations are skipped by type up front
+        # (ShuttleMove.duration is always > 0)
+        shuttles = [
+            (op.start_time, op.start_time + op.duration, i)
+            for i, op in enumerate(operations)
+            if isinstance(op, ShuttleMove)
+        ]
+        if len(shuttles) > 1:
+            starts, ends, op_idx = (np.array(col) for col in zip(*shuttles))
+            # Pairs come back as (earlier, later) shuttle positions, sorted,
+            # so warnings keep operation order
+            first, second = _overlap_pairs(
+                starts.astype(np.float64), ends.astype(np.float64)
+            )
+            crossing = np.zeros(len(first), dtype=bool)
+            if shuttle_paths:
+                keys = op_idx.tolist()
+                boxes = np.array(
+                    [_shuttle_bbox(shuttle_paths[k]) if k in shuttle_paths
+                     else (np.inf, -np.inf, np.inf, -np.inf) for k in keys],
+                    dtype=np.float64
+                ).reshape(-1, 4)
+                crossing = _boxes_intersect(boxes[first], boxes[second])
+                for n in np.flatnonzero(crossing).tolist():
+                    crossing[n] = _segments_intersect(
+                        shuttle_paths[keys[first[n]]], shuttle_paths[keys[second[n]]]
+                    )
+            for op1, op2, crosses in zip(
+                op_idx[first].tolist(), op_idx[second].tolist(), crossing.tolist()
+            ):
+                warnings.append(ValidationWarning(
+                    code="CONCURRENT_SHUTTLES",
+                    message=f"Shuttle operations {op1} and {op2} overlap in time - may cause coordination issues",
+                    severity="high",
+                    operation_index=op2
+                ))
+                if crosses:
                     warnings.append(ValidationWarning(
-                        code="CONCURRENT_SHUTTLES",
-                        message=f"Shuttle operations {i1} and {i2} overlap in time - may cause coordination issues",
+                        code="SPATIAL_SHUTTLE_CROSSING",
+                        message=f"Concurrent shuttle operations {op1} and {op2} move atoms along intersecting paths - trajectories may cross",
                         severity="high",
-                        operation_index=i2
+                        operation_index=op2
                     ))
         
         return warnings
@@ -676,6 +1238,27 @@ class PulserValidator:
 # CONVENIENCE FUNCTIONS
 # =============================================================================
 
+_default_validators: dict[bool, PulserValidator] = {}
+
+
+def get_default_validator(strict: bool = True) -> PulserValidator:
+    """
+    Shared PulserValidator with default settings.
+    
+    validate() keeps no per-job state on the instance (it only reads the
+    constructor settings), so one instance per strict flag serves every
+    caller. Do not mutate the returned validator's settings.
+    
+    Args:
+        strict: If True, edge cases become errors
+    """
+    validator = _default_validators.get(strict)
+    if validator is None:
+        # setdefault keeps the first instance if two threads race here
+        validator = _default_validators.setdefault(strict, PulserValidator(strict_mode=strict))
+    return validator
+
+
 def validate_job(job: NeutralAtomJob, strict: bool = True) -> ValidationResult:
     """
     Convenience function to validate a job with default settings.
@@ -687,8 +1270,7 @@ def validate_job(job: NeutralAtomJob, strict: bool = True) -> ValidationResult:
     Returns:
         ValidationResult
     """
-    validator = PulserValidator(strict_mode=strict)
-    return validator.validate(job)
+    return get_default_validator(strict).validate(job)
 
 
 def quick_validate(job: NeutralAtomJob) -> None:
@@ -11,10 +11,22 @@ Based on:
 - "Continuous operation..." (Chiu et al., 2025) - Heating Models
 """
 
-import math
 import random
+import numpy as np
 import networkx as nx
-from typing import List, Tuple, Dict, Any
+from typing import Dict, Any, Optional
+
+
+# AOD conflict penalty (Lambda) in the total cost
+CONFLICT_PENALTY = 5.0
+
+# Probability that a gate needs a row/col crossing move, per placement
+RANDOM_CONFLICT_PROB = 0.3     # High probability of row/col crossing
+SPECTRAL_CONFLICT_PROB = 0.05  # Low conflict
+
+# Optimized placement: close neighbours
+SPECTRAL_AVG_DISTANCE = 1.8  # Euclidean dist for near neighbors
+
 
 class SpectralAODRouter:
     def __init__(self, width: int = 10, height: int = 10):
@@ -22,23 +34,39 @@ class SpectralAODRouter:
         self.height = height
         self.grid_size = width * height
         
-    def generate_random_circuit_graph(self, num_qubits: int, num_gates: int) -> nx.Graph:
-        """Generates a dependency graph for a random quantum circuit."""
+    def generate_random_circuit_graph(
+        self,
+        num_qubits: int,
+        num_gates: int,
+        rng: Optional[np.random.Generator] = None
+    ) -> nx.Graph:
+        """
+        Generates a dependency graph for a random quantum circuit.
+        
+        Pass `rng` for an explicit NumPy generator; by default one is seeded
+        from the `random` module so random.seed() keeps graphs reproducible.
+        """
+        if rng is None:
+            rng = np.random.default_rng(random.getrandbits(64))
+        
         G = nx.Graph()
         G.add_nodes_from(range(num_qubits))
+        if num_gates <= 0:
+            return G
+        if num_qubits < 2:
+            raise ValueError("Two-qubit gates need at least 2 qubits")
         
-        # Add random two-qubit gates (edges)
-        for _ in range(num_gates):
-            u = random.randint(0, num_qubits - 1)
-            v = random.randint(0, num_qubits - 1)
-            while v == u:
-                v = random.randint(0, num_qubits - 1)
-            
-            # Weighted edge: weight represents number of interactions
-            if G.has_edge(u, v):
-                G[u][v]['weight'] += 1
-            else:
-                G.add_edge(u, v, weight=1)
+        # Random two-qubit gates (edges): v is drawn uniformly among the
+        # other qubits, so there are no self-loops to reject
+        u = rng.integers(0, num_qubits, size=num_gates)
+        v = (u + rng.integers(1, num_qubits, size=num_gates)) % num_qubits
+        pairs = np.sort(np.column_stack((u, v)), axis=1)
+        
+        # Weighted edge: weight represents number of interactions
+        edges, counts = np.unique(pairs, axis=0, return_counts=True)
+        G.add_weighted_edges_from(
+            zip(edges[:, 0].tolist(), edges[:, 1].tolist(), counts.tolist())
+        )
         return G
 
     def optimize_mapping(self, graph: nx.Graph) -> Dict[str, Any]:
@@ -46,14 +74,21 @@ class SpectralAODRouter:
         Maps qubits to a 2D grid using Spectral Layout.
         Cost function: Total Euclidean Distance + AOD Conflict Penalty.
         """
-        # 1. Spectral Layout (Continuous relaxation)
-        pos_spectral = nx.spectral_layout(graph, weight='weight', scale=self.width/2)
-        
-        # 2. Heuristic: Calculate costs
-        # Heuristic for "Unoptimized" (Random) vs "Optimized" (Spectral)
+        # Heuristic for "Unoptimized" (Random) vs "Optimized" (Spectral).
+        # Analytical approximation for simulation speed (O(E)): every gate
+        # costs the placement's average distance, so only the total weight
+        # and one conflict draw per edge are needed.
+        total_weight = graph.size(weight='weight')
+        num_edges = graph.number_of_edges()
+        draws_rand = np.random.default_rng(random.getrandbits(64)).random(num_edges)
+        draws_spec = np.random.default_rng(random.getrandbits(64)).random(num_edges)
         
-        unopt_cost = self._calculate_physics_cost(graph, mode="random")
-        opt_cost = self._calculate_physics_cost(graph, mode="spectral")
+        rand_dist = total_weight * self._avg_distance("random")
+        spec_dist = total_weight * self._avg_distance("spectral")
+        rand_conf = int(np.count_nonzero(draws_rand < RANDOM_CONFLICT_PROB))
+        spec_conf = int(np.count_nonzero(draws_spec < SPECTRAL_CONFLICT_PROB))
+        unopt_cost = self._cost_dict(rand_dist, rand_conf)
+        opt_cost = self._cost_dict(spec_dist, spec_conf)
         
         # Heating reduction proportional to distance reduction
         heating_reduction = (unopt_cost['total_distance'] - opt_cost['total_distance']) / unopt_cost['total_distance'] if unopt_cost['total_distance'] > 0 else 0
@@ -67,60 +102,58 @@ class SpectralAODRouter:
             "method": "Spectral-AOD-Heuristic"
         }
 
+    def _avg_distance(self, mode: str) -> float:
+        """Per-gate distance of the analytic cost model."""
+        if mode == "random":
+            # Avg limited by grid dimensions
+            return (self.width + self.height) / 2.5
+        return SPECTRAL_AVG_DISTANCE
+
     def _calculate_physics_cost(self, graph: nx.Graph, mode: str) -> Dict[str, float]:
         """
         Calculates physical cost:
         - Distance: Sum of Euclidean distances for all gates (Heating)
         - AOD Conflicts: Penalty for non-rectilinear moves or crossing paths (Validity)
         """
-        nodes = list(graph.nodes)
-        positions = {}
-        
-        if mode == "random":
-            # Random shuffle on grid slots
-            grid_slots = random.sample([(x, y) for x in range(self.width) for y in range(self.height)], len(nodes))
-            for i, node in enumerate(nodes):
-                positions[node] = grid_slots[i]
-        else:
-            # Spectral-like proxy (Simplified for simulation speed)
-            # In a real compiler, we'd snap Fiedler vectors to grid integers
-            # Here we assume optimized placement reduces average distance to ~1.41 (neighbors)
-            # and reduces conflicts significantly.
-            pass # Calculation handled abstractly below for simulation speed
-
-        total_dist = 0.0
-        conflicts = 0
+        conflict_prob = RANDOM_CONFLICT_PROB if mode == "random" else SPECTRAL_CONFLICT_PROB
         
         # Analytical approximation for simulation speed (O(E))
-        # instead of full integer programming placement
-        avg_dist = 0.0
-        conflict_prob = 0.0
-        
-        if mode == "random":
-             # Avg limited by grid dimensions
-             avg_dist = (self.width + self.height) / 2.5
-             conflict_prob = 0.3 # High probability of row/col crossing
-        else:
-             # Optimized: close neighbors
-             avg_dist = 1.8 # Euclidean dist for near neighbors
-             conflict_prob = 0.05 # Low conflict
-             
-        for u, v, data in graph.edges(data=True):
-            weight = data['weight']
-            total_dist += weight * avg_dist
-            if random.random() < conflict_prob:
-                conflicts += 1
-                
+        # instead of full integer programming placement. Conflict draws come
+        # from a generator seeded off the `random` module so random.seed()
+        # still makes runs reproducible.
+        draws = np.random.default_rng(random.getrandbits(64)).random(graph.number_of_edges())
+        total_dist = graph.size(weight='weight') * self._avg_distance(mode)
+        return self._cost_dict(total_dist, int(np.count_nonzero(draws < conflict_prob)))
+
+    @staticmethod
+    def _cost_dict(total_dist: float, conflicts: int) -> Dict[str, float]:
+        """Package distance and conflict count as the physics cost record."""
         # Total Cost = Distance + Lambda * Conflicts
-        # Lambda = 5.0 (Penalty weight)
-        total_cost = total_dist + (5.0 * conflicts)
-        
         return {
-            "total_distance": total_dist,
-            "aod_conflicts": conflicts,
-            "total_cost": total_cost
+            "total_distance": float(total_dist),
+            "aod_conflicts": int(conflicts),
+            "total_cost": float(total_dist) + CONFLICT_PENALTY * int(conflicts)
         }
 
+def run_topology_optimization(
+    width: int,
+    height: int,
+    num_qubits: int,
+    num_gates: int,
+    seed: int
+) -> Dict[str, Any]:
+    """
+    Builds a random circuit and maps it, reproducibly for a given seed.
+    
+    Meant to run in a worker process: every draw (circuit, placements,
+    conflicts) comes off the `random` module, which is re-seeded per call
+    so pooled workers never share or carry over RNG state.
+    """
+    random.seed(seed)
+    opt = SpectralAODRouter(width, height)
+    graph = opt.generate_random_circuit_graph(num_qubits, num_gates)
+    return opt.optimize_mapping(graph)
+
 # Standalone run
 if __name__ == "__main__":
     opt = TILTOptimizer(20, 20)
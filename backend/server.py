@@ -14,21 +14,29 @@ SECURITY NOTES:
 import os
 import sys
 import re
-import subprocess
-import json
+import math
 import asyncio
 import logging
 import random
 import uuid
 import secrets
-from typing import List, Optional, Dict, Any, Set
+import hashlib
+import hmac
+import multiprocessing
+import struct
+import time
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+import orjson
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Header, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.openapi.utils import get_openapi
-from pydantic import BaseModel, field_validator
-from optimizer import SpectralAODRouter
+from pydantic import BaseModel, Field, ValidationError, field_validator
+from optimizer import run_topology_optimization
 from benchmarks.benchmark_qram import run_benchmark as run_qram_benchmark
 from benchmarks.benchmark_crypto import run_crypto_benchmark
 from benchmarks.qram_phononic import run_phononic_benchmark
@@ -44,6 +52,13 @@ logger = logging.getLogger(__name__)
 # FastAPI Application with OpenAPI/Swagger Documentation
 # ============================================================================
 
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (several times faster than stdlib json)."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
 app = FastAPI(
     title="Q-Orchestrator API",
     description="""
@@ -112,7 +127,8 @@ Todas las rutas protegidas requieren el header `X-API-Key`.
     ],
     docs_url="/docs",
     redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse
 )
 
 # ============================================================================
@@ -145,6 +161,10 @@ def _validate_api_key_on_startup():
 
 _validate_api_key_on_startup()
 
+# Keys are compared as SHA-256 digests: fixed length, so the comparison time
+# does not depend on the key length, and the configured key is hashed only once
+_API_KEY_DIGEST = hashlib.sha256(API_KEY.encode()).digest() if API_KEY else None
+
 # Allowed origins - configure via environment variable for production
 # Format: comma-separated list of origins
 ALLOWED_ORIGINS = os.getenv(
@@ -165,48 +185,55 @@ app.add_middleware(
 PYTHON_EXE = os.getenv("PYTHON_EXE", sys.executable)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 BENCHMARKS_DIR = os.path.join(BASE_DIR, "benchmarks")
-FAVORITES_FILE = os.path.join(BASE_DIR, "favorites.json")
+
+# Benchmark scripts available on disk, scanned once at startup. Requests are
+# resolved against this set, so no per-request realpath/exists syscalls are
+# needed and paths outside BENCHMARKS_DIR can never be selected.
+BENCHMARK_SCRIPTS: frozenset = frozenset(
+    entry.name for entry in os.scandir(BENCHMARKS_DIR)
+    if entry.is_file() and entry.name.startswith("benchmark_") and entry.name.endswith(".py")
+) if os.path.isdir(BENCHMARKS_DIR) else frozenset()
+FAVORITES_FILE = os.path.join(BASE_DIR, "favorites.jsonl")
+LEGACY_FAVORITES_FILE = os.path.join(BASE_DIR, "favorites.json")
 
 # ============================================================================
 # Input Validation - Whitelist of allowed benchmark types
 # ============================================================================
 
-ALLOWED_BENCHMARK_TYPES: Set[str] = {
+ALLOWED_BENCHMARK_TYPES: frozenset = frozenset({
     "velocity_fidelity",
     "ancilla_vs_swap",
     "cooling_strategies",
     "zoned_cycles",
     "sustainable_depth",
     "full"
-}
+})
+_ALLOWED_BENCHMARK_TYPES_TEXT = ", ".join(sorted(ALLOWED_BENCHMARK_TYPES))
 
-# Regex pattern for valid benchmark type format (alphanumeric + underscore only)
-BENCHMARK_TYPE_PATTERN = re.compile(r"^[a-z][a-z0-9_]{0,49}$")
+# Regex pattern for WebSocket client IDs (used with fullmatch)
+CLIENT_ID_PATTERN = re.compile(r"[a-zA-Z0-9_\-]{1,64}")
 
 def validate_benchmark_type(benchmark_type: str) -> str:
     """
-    Validates benchmark_type against whitelist and pattern to prevent injection attacks.
+    Validates benchmark_type against the whitelist to prevent injection attacks.
     
     Raises:
-        ValueError: If benchmark_type is not in allowed list or contains invalid characters
+        ValueError: If benchmark_type is not a string in the allowed list
     """
-    if not benchmark_type:
-        raise ValueError("Benchmark type cannot be empty")
+    if not isinstance(benchmark_type, str) or not benchmark_type:
+        raise ValueError("Benchmark type must be a non-empty string")
     
     # Normalize and strip
     benchmark_type = benchmark_type.strip().lower()
     
-    # Check against whitelist first (most secure)
+    # Exact whitelist match; every allowed name is plain [a-z_], so no further
+    # pattern check is needed
     if benchmark_type not in ALLOWED_BENCHMARK_TYPES:
         raise ValueError(
             f"Invalid benchmark type '{benchmark_type}'. "
-            f"Allowed types: {', '.join(sorted(ALLOWED_BENCHMARK_TYPES))}"
+            f"Allowed types: {_ALLOWED_BENCHMARK_TYPES_TEXT}"
         )
     
-    # Additional pattern validation (defense in depth)
-    if not BENCHMARK_TYPE_PATTERN.match(benchmark_type):
-        raise ValueError("Benchmark type contains invalid characters")
-    
     return benchmark_type
 
 def verify_api_key(provided_key: Optional[str]) -> bool:
@@ -216,7 +243,10 @@ def verify_api_key(provided_key: Optional[str]) -> bool:
         if IS_DEV_MODE and not API_KEY:
             return True
         return False
-    return secrets.compare_digest(provided_key, API_KEY)
+    if not isinstance(provided_key, str):
+        return False
+    provided_digest = hashlib.sha256(provided_key.encode()).digest()
+    return hmac.compare_digest(provided_digest, _API_KEY_DIGEST)
 
 # ============================================================================
 # Data Models with Validation
@@ -230,6 +260,16 @@ class RunBenchmarkRequest(BaseModel):
     def validate_type(cls, v: str) -> str:
         return validate_benchmark_type(v)
 
+class BenchmarkCmd(BaseModel):
+    """Benchmark command sent over the WebSocket after authentication."""
+    benchmark_type: str = "velocity_fidelity"
+    cycles: int = Field(50, ge=1, le=1000, strict=True)
+    
+    @field_validator('benchmark_type')
+    @classmethod
+    def validate_type(cls, v: str) -> str:
+        return validate_benchmark_type(v)
+
 class ComparisonConfig(BaseModel):
     id: Optional[str] = None
     name: str
@@ -275,49 +315,295 @@ class TelemetryPayload(BaseModel):
     decoder_backlog_ms: float
     timestamp: str
 
+# Telemetry timestamps: the date/time prefix only changes once per second, so
+# it is formatted once and reused; only the microseconds are formatted per frame
+_ts_second = -1
+_ts_prefix = ""
+
+def iso_timestamp() -> str:
+    """Returns the current local time in ISO 8601 format (microsecond precision)."""
+    global _ts_second, _ts_prefix
+    now = time.time()
+    second = int(now)
+    if second != _ts_second:
+        _ts_prefix = datetime.fromtimestamp(second).strftime("%Y-%m-%dT%H:%M:%S")
+        _ts_second = second
+    return f"{_ts_prefix}.{int((now - second) * 1_000_000):06d}"
+
+
+def round_half_up(value: float, scale: int) -> float:
+    """Rounds a non-negative telemetry value half-up to 1/scale precision."""
+    return int(value * scale + 0.5) / scale
+
+# Binary telemetry wire format (negotiated at auth with "wire": "binary").
+# Fixed 33-byte little-endian record, several records per message when batched:
+#   u8 status | u32 cycle | u32 atoms_lost | f32 percentage | f32 n_vib
+#   | f32 fidelity | f32 decoder_backlog_ms | u64 timestamp (ns since epoch)
+TELEMETRY_STRUCT = struct.Struct("<BIIffffQ")
+_TIMESTAMP_NS = struct.Struct("<Q")
+
+TELEMETRY_STATUS_IDS: Dict[str, int] = {
+    "CONNECTING": 0,
+    "RUNNING": 1,
+    "COMPLETED": 2,
+    "STOPPED": 3,
+    "ERROR": 4,
+    "AUTH_REQUIRED": 5,
+}
+
+def pack_telemetry(telemetry: Dict[str, Any]) -> bytes:
+    """Encodes a telemetry payload as one binary record, stamped with the current time."""
+    return TELEMETRY_STRUCT.pack(
+        TELEMETRY_STATUS_IDS[telemetry["status"]],
+        telemetry["cycle"],
+        telemetry["atoms_lost"],
+        telemetry["percentage"],
+        telemetry["n_vib"],
+        telemetry["fidelity"],
+        telemetry["decoder_backlog_ms"],
+        time.time_ns()
+    )
+
+# Status frames sent before a simulation starts carry no physics data; only the
+# timestamp varies, so they are serialized once and the timestamp is swapped in
+# (a placeholder for JSON, the trailing u64 for binary records)
+_TIMESTAMP_PLACEHOLDER = "__TS__"
+
+def _build_static_frame(status: str, fidelity: float = 0.0) -> Tuple[str, bytes]:
+    payload = TelemetryPayload(
+        status=status,
+        percentage=0,
+        cycle=0,
+        atoms_lost=0,
+        n_vib=0,
+        fidelity=fidelity,
+        decoder_backlog_ms=0,
+        timestamp=_TIMESTAMP_PLACEHOLDER
+    ).model_dump()
+    json_frame = orjson.dumps(payload).decode()
+    binary_head = pack_telemetry(payload)[:-_TIMESTAMP_NS.size]
+    return json_frame, binary_head
+
+_AUTH_REQUIRED_FRAME = _build_static_frame("AUTH_REQUIRED")
+_ERROR_FRAME = _build_static_frame("ERROR")
+_CONNECTING_FRAME = _build_static_frame("CONNECTING", fidelity=1.0)
+_STOPPED_FRAME = _build_static_frame("STOPPED")
+
+def stamp_static_frame(frame: Tuple[str, bytes]) -> Tuple[str, bytes]:
+    """Returns the JSON and binary encodings of a static frame stamped with the current time."""
+    json_frame, binary_head = frame
+    return (
+        json_frame.replace(_TIMESTAMP_PLACEHOLDER, iso_timestamp(), 1),
+        binary_head + _TIMESTAMP_NS.pack(time.time_ns())
+    )
+
+async def send_static_frame(websocket: WebSocket, frame: Tuple[str, bytes], binary: bool = False):
+    """Sends a pre-serialized status frame stamped with the current time."""
+    json_frame, binary_frame = stamp_static_frame(frame)
+    if binary:
+        await websocket.send_bytes(binary_frame)
+    else:
+        await websocket.send_text(json_frame)
+
 # ============================================================================
 # WebSocket Manager
 # ============================================================================
 
+# Upper bound on telemetry frames coalesced into a single WebSocket message
+TELEMETRY_MAX_BATCH = 64
+# Frames buffered per client; when a slow client falls further behind, the
+# oldest frames are dropped so memory stays bounded
+TELEMETRY_QUEUE_MAXSIZE = 64
+
 class BenchmarkConnectionManager:
-    """Manages active WebSocket connections for benchmark telemetry."""
+    """
+    Manages active WebSocket connections for benchmark telemetry.
+    
+    Per-client state is stored as parallel arrays (struct of arrays) indexed
+    through a client_id -> slot map; disconnect swaps the last slot into the
+    freed one, so the arrays stay dense for fan-out loops.
+    
+    Telemetry is queued per client and sent by a dedicated writer task, which
+    coalesces frames that piled up since its last send into one message: a
+    JSON array (a bare object when only one frame is pending), or
+    concatenated TELEMETRY_STRUCT records for binary clients.
+    """
     
     def __init__(self):
-        self.active_connections: Dict[str, WebSocket] = {}
-        self.running_benchmarks: Dict[str, bool] = {}
-        self.authenticated_clients: Set[str] = set()
+        self._index: Dict[str, int] = {}
+        self.client_ids: List[str] = []
+        self.websockets: List[WebSocket] = []
+        self.auth_flags = bytearray()
+        self.binary_flags = bytearray()
+        self.stop_flags = bytearray()
+        self.telemetry_queues: List[Optional[asyncio.Queue]] = []
+        self.writer_tasks: List[Optional[asyncio.Task]] = []
+        self.dropped_frames: List[int] = []
     
     async def connect(self, client_id: str, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections[client_id] = websocket
+        if client_id in self._index:
+            self.disconnect(client_id)  # Reconnect under the same ID replaces the old session
+        self._index[client_id] = len(self.client_ids)
+        self.client_ids.append(client_id)
+        self.websockets.append(websocket)
+        self.auth_flags.append(0)
+        self.binary_flags.append(0)
+        self.stop_flags.append(0)
+        self.telemetry_queues.append(None)
+        self.writer_tasks.append(None)
+        self.dropped_frames.append(0)
         logger.info(f"WebSocket connected (pending auth): {client_id}")
     
-    def authenticate(self, client_id: str):
-        self.authenticated_clients.add(client_id)
-        self.running_benchmarks[client_id] = True
+    def authenticate(self, client_id: str, binary: bool = False):
+        i = self._index[client_id]
+        self.auth_flags[i] = 1
+        self.binary_flags[i] = binary
+        queue: asyncio.Queue = asyncio.Queue(maxsize=TELEMETRY_QUEUE_MAXSIZE)
+        self.telemetry_queues[i] = queue
+        self.writer_tasks[i] = asyncio.create_task(
+            self._telemetry_writer(client_id, self.websockets[i], queue, binary)
+        )
         logger.info(f"WebSocket authenticated: {client_id}")
     
     def is_authenticated(self, client_id: str) -> bool:
-        return client_id in self.authenticated_clients
+        i = self._index.get(client_id)
+        return i is not None and self.auth_flags[i] == 1
     
     def disconnect(self, client_id: str):
-        if client_id in self.active_connections:
-            del self.active_connections[client_id]
-        if client_id in self.running_benchmarks:
-            del self.running_benchmarks[client_id]
-        self.authenticated_clients.discard(client_id)
+        i = self._index.pop(client_id, None)
+        if i is None:
+            return
+        writer = self.writer_tasks[i]
+        if writer is not None:
+            writer.cancel()
+        if self.dropped_frames[i]:
+            logger.warning(f"Dropped {self.dropped_frames[i]} telemetry frames for slow client {client_id}")
+        # Swap-remove: move the last slot into i and shrink every array by one
+        last = len(self.client_ids) - 1
+        if i != last:
+            moved_id = self.client_ids[last]
+            self._index[moved_id] = i
+            self.client_ids[i] = moved_id
+            self.websockets[i] = self.websockets[last]
+            self.auth_flags[i] = self.auth_flags[last]
+            self.binary_flags[i] = self.binary_flags[last]
+            self.stop_flags[i] = self.stop_flags[last]
+            self.telemetry_queues[i] = self.telemetry_queues[last]
+            self.writer_tasks[i] = self.writer_tasks[last]
+            self.dropped_frames[i] = self.dropped_frames[last]
+        self.client_ids.pop()
+        self.websockets.pop()
+        self.auth_flags.pop()
+        self.binary_flags.pop()
+        self.stop_flags.pop()
+        self.telemetry_queues.pop()
+        self.writer_tasks.pop()
+        self.dropped_frames.pop()
         logger.info(f"WebSocket disconnected: {client_id}")
     
-    async def send_telemetry(self, client_id: str, telemetry: TelemetryPayload):
-        if client_id in self.active_connections:
-            await self.active_connections[client_id].send_json(telemetry.model_dump())
+    def should_stop(self, client_id: str) -> bool:
+        """True once the benchmark was stopped or the client has disconnected."""
+        i = self._index.get(client_id)
+        return i is None or self.stop_flags[i] == 1
+    
+    async def send_telemetry(self, client_id: str, telemetry: Dict[str, Any]):
+        """
+        Queues one telemetry frame for the client's writer task.
+        
+        Frames are plain dicts shaped like TelemetryPayload: the simulation
+        builds them every cycle, so model construction is skipped there.
+        """
+        i = self._index.get(client_id)
+        if i is None:
+            return
+        queue = self.telemetry_queues[i]
+        if queue is None:
+            return
+        frame = pack_telemetry(telemetry) if self.binary_flags[i] else telemetry
+        self._enqueue(i, queue, frame)
+    
+    def _enqueue(self, i: int, queue: asyncio.Queue, frame: Any):
+        """Queues a frame, dropping the oldest one if the client's queue is full."""
+        try:
+            queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            queue.get_nowait()
+            queue.put_nowait(frame)
+            self.dropped_frames[i] += 1
+    
+    async def flush_telemetry(self, client_id: str):
+        """Waits until all queued telemetry is sent, then stops the writer task."""
+        i = self._index.get(client_id)
+        if i is None:
+            return
+        queue, writer = self.telemetry_queues[i], self.writer_tasks[i]
+        self.telemetry_queues[i] = None
+        self.writer_tasks[i] = None
+        if queue is None or writer is None:
+            return
+        self._enqueue(i, queue, None)  # Sentinel: writer exits after sending the backlog
+        await writer
+    
+    async def _telemetry_writer(
+        self,
+        client_id: str,
+        websocket: WebSocket,
+        queue: asyncio.Queue,
+        binary: bool = False
+    ):
+        """Sends queued frames, batching whatever is pending into one message."""
+        batch: List[Any] = []
+        try:
+            while True:
+                frame = await queue.get()
+                while frame is not None:
+                    batch.append(frame)
+                    if queue.empty() or len(batch) >= TELEMETRY_MAX_BATCH:
+                        break
+                    frame = queue.get_nowait()
+                if batch:
+                    if binary:
+                        await websocket.send_bytes(b"".join(batch))
+                    else:
+                        # A lone frame goes out as a bare object, several as an array
+                        await websocket.send_text(
+                            orjson.dumps(batch[0] if len(batch) == 1 else batch).decode()
+                        )
+                    batch.clear()
+                if frame is None:
+                    return
+        except Exception as e:
+            logger.warning(f"Telemetry writer stopped for {client_id}: {str(e)}")
+            self.stop_benchmark(client_id)
     
     def stop_benchmark(self, client_id: str):
-        if client_id in self.running_benchmarks:
-            self.running_benchmarks[client_id] = False
+        i = self._index.get(client_id)
+        if i is not None and self.auth_flags[i]:
+            self.stop_flags[i] = 1
+    
+    async def broadcast(self, frame: Tuple[str, bytes]):
+        """
+        Sends one frame to every authenticated client concurrently.
+        
+        The frame is serialized once per wire format (see stamp_static_frame)
+        and shared by all sends; a failing client does not affect the others.
+        """
+        json_frame, binary_frame = frame
+        sends = [
+            ws.send_bytes(binary_frame) if self.binary_flags[i] else ws.send_text(json_frame)
+            for i, ws in enumerate(self.websockets) if self.auth_flags[i]
+        ]
+        if sends:
+            await asyncio.gather(*sends, return_exceptions=True)
 
 manager = BenchmarkConnectionManager()
 
+@app.on_event("shutdown")
+async def notify_clients_of_shutdown():
+    """Tells connected clients their benchmark stops because the server is going down."""
+    await manager.broadcast(stamp_static_frame(_STOPPED_FRAME))
+
 # ============================================================================
 # Benchmark Simulation Engine (Physics-Based)
 # ============================================================================
@@ -335,14 +621,10 @@ async def simulate_benchmark_execution(
     - Atom loss probability per cycle
     - Heating accumulation (n_vib)
     - Decoder latency simulation
-    """
     
-    # Validate benchmark_type again (defense in depth)
-    try:
-        benchmark_type = validate_benchmark_type(benchmark_type)
-    except ValueError as e:
-        logger.error(f"Invalid benchmark type in simulation: {e}")
-        return
+    Note: benchmark_type must already be validated by the caller
+    (see websocket_benchmark).
+    """
     
     # Validate total_cycles
     total_cycles = max(1, min(total_cycles, 1000))  # Clamp to reasonable range
@@ -353,23 +635,36 @@ async def simulate_benchmark_execution(
     HEATING_RATE = 0.05  # n_vib increase per cycle
     COOLING_THRESHOLD = 1.5  # When to "cool"
     
+    # Decoder capacity C = C0 * exp(-alpha * d); d only takes the values
+    # 3, 5 and 7, so the exponentials are computed once per run
+    DECODER_C0 = 10.0
+    DECODER_ALPHA = 0.4
+    capacity_by_distance = {
+        d: DECODER_C0 * math.exp(-DECODER_ALPHA * d) for d in (3, 5, 7)
+    }
+    
     n_vib = 0.0
     total_atoms_lost = 0
     fidelity = 0.9999
+    syndrome_queue = 0.0  # Decoder backlog queue state
+    
+    # Only authenticated clients may run a simulation
+    if not manager.is_authenticated(client_id):
+        return
     
     for cycle in range(1, total_cycles + 1):
-        # Check if benchmark was stopped
-        if not manager.running_benchmarks.get(client_id, False):
-            await manager.send_telemetry(client_id, TelemetryPayload(
-                status="STOPPED",
-                percentage=100.0 * cycle / total_cycles,
-                cycle=cycle,
-                atoms_lost=total_atoms_lost,
-                n_vib=n_vib,
-                fidelity=fidelity,
-                decoder_backlog_ms=0,
-                timestamp=datetime.now().isoformat()
-            ))
+        # Check if benchmark was stopped (stop_benchmark) or the client left
+        if manager.should_stop(client_id):
+            await manager.send_telemetry(client_id, {
+                "status": "STOPPED",
+                "percentage": 100.0 * cycle / total_cycles,
+                "cycle": cycle,
+                "atoms_lost": total_atoms_lost,
+                "n_vib": n_vib,
+                "fidelity": fidelity,
+                "decoder_backlog_ms": 0.0,
+                "timestamp": iso_timestamp()
+            })
             return
         
         # Simulate zone reordering latency (~20ms)
@@ -393,10 +688,6 @@ async def simulate_benchmark_execution(
         # Based on Riverlane LCD / Google Willow:
         # If Decoding Rate < Syndrome Generation Rate, the queue explodes (Death Point).
         
-        # Initialize queue state
-        if cycle == 1:
-            syndrome_queue = 0.0
-        
         # 1. Syndrome Generation (R_syn)
         # Assume 1 syndrome batch per cycle
         new_syndromes = 1.0 
@@ -407,15 +698,10 @@ async def simulate_benchmark_execution(
         if cycle > 15: d = 5 
         if cycle > 30: d = 7
         
-        # Capacity equation: C = C0 * exp(-alpha * d)
-        c0 = 10.0 
-        alpha = 0.4
-        decoding_capacity = c0 * math.exp(-alpha * d) * random.uniform(0.9, 1.1)
+        # Capacity equation: C = C0 * exp(-alpha * d) (precomputed above)
+        decoding_capacity = capacity_by_distance[d] * random.uniform(0.9, 1.1)
         
         # 3. Queue Update
-        if 'syndrome_queue' not in locals(): 
-            syndrome_queue = 0.0
-            
         syndrome_queue += new_syndromes
         processed = min(syndrome_queue, decoding_capacity)
         syndrome_queue -= processed
@@ -428,35 +714,31 @@ async def simulate_benchmark_execution(
         else:
             latency = time_to_clear
             
-        # Expose as 'decoder_backlog' for telemetry (unrounded, rounded later)
-        decoder_backlog = latency
-        decoder_backlog_ms = round(latency, 2)
-        
         # Send telemetry
-        telemetry = TelemetryPayload(
-            status="RUNNING",
-            percentage=100.0 * cycle / total_cycles,
-            cycle=cycle,
-            atoms_lost=total_atoms_lost,
-            n_vib=round(n_vib, 3),
-            fidelity=round(fidelity, 6),
-            decoder_backlog_ms=round(decoder_backlog, 2),
-            timestamp=datetime.now().isoformat()
-        )
+        telemetry = {
+            "status": "RUNNING",
+            "percentage": 100.0 * cycle / total_cycles,
+            "cycle": cycle,
+            "atoms_lost": total_atoms_lost,
+            "n_vib": round_half_up(n_vib, 1000),
+            "fidelity": round_half_up(fidelity, 1_000_000),
+            "decoder_backlog_ms": round_half_up(latency, 100),
+            "timestamp": iso_timestamp()
+        }
         
         await manager.send_telemetry(client_id, telemetry)
     
     # Final telemetry
-    await manager.send_telemetry(client_id, TelemetryPayload(
-        status="COMPLETED",
-        percentage=100.0,
-        cycle=total_cycles,
-        atoms_lost=total_atoms_lost,
-        n_vib=round(n_vib, 3),
-        fidelity=round(fidelity, 6),
-        decoder_backlog_ms=0,
-        timestamp=datetime.now().isoformat()
-    ))
+    await manager.send_telemetry(client_id, {
+        "status": "COMPLETED",
+        "percentage": 100.0,
+        "cycle": total_cycles,
+        "atoms_lost": total_atoms_lost,
+        "n_vib": round_half_up(n_vib, 1000),
+        "fidelity": round_half_up(fidelity, 1_000_000),
+        "decoder_backlog_ms": 0.0,
+        "timestamp": iso_timestamp()
+    })
 
 # ============================================================================
 # API Endpoints
@@ -494,9 +776,13 @@ async def websocket_benchmark(websocket: WebSocket, client_id: str):
     Connection Protocol:
     1. Connect: ws://localhost:8000/ws/benchmarks/<unique_client_id>
     2. First message MUST be auth: {"type": "auth", "token": "<api_key>"}
+       Add "wire": "binary" to receive binary telemetry (see TELEMETRY_STRUCT)
     3. Then send benchmark command: {"benchmark_type": "...", "cycles": 50}
+       (cycles: 1-1000; an invalid command is answered with an ERROR frame)
     
-    The server will stream JSON telemetry payloads with:
+    By default the server streams JSON telemetry payloads: one object per
+    message, or an array when frames produced faster than they can be sent are
+    batched into one message. Each payload has:
     - status: AUTH_REQUIRED, CONNECTING, RUNNING, COMPLETED, STOPPED, ERROR
     - percentage: 0-100
     - cycle: Current QEC cycle number
@@ -504,10 +790,10 @@ async def websocket_benchmark(websocket: WebSocket, client_id: str):
     - n_vib: Vibrational quantum number (heating indicator)
     - fidelity: Current logical fidelity
     - decoder_backlog_ms: Decoder latency
-    - timestamp: ISO timestamp
+    - timestamp: ISO timestamp (ns since epoch in binary records)
     """
     # Validate client_id format to prevent injection
-    if not re.match(r'^[a-zA-Z0-9_\-]{1,64}$', client_id):
+    if not CLIENT_ID_PATTERN.fullmatch(client_id):
         await websocket.close(code=4000, reason="Invalid client ID format")
         return
     
@@ -519,16 +805,7 @@ async def websocket_benchmark(websocket: WebSocket, client_id: str):
         auth_data = await asyncio.wait_for(websocket.receive_json(), timeout=10.0)
         
         if auth_data.get("type") != "auth":
-            await manager.send_telemetry(client_id, TelemetryPayload(
-                status="AUTH_REQUIRED",
-                percentage=0,
-                cycle=0,
-                atoms_lost=0,
-                n_vib=0,
-                fidelity=0,
-                decoder_backlog_ms=0,
-                timestamp=datetime.now().isoformat()
-            ))
+            await send_static_frame(websocket, _AUTH_REQUIRED_FRAME)
             await websocket.close(code=4001, reason="First message must be auth")
             manager.disconnect(client_id)
             return
@@ -536,64 +813,32 @@ async def websocket_benchmark(websocket: WebSocket, client_id: str):
         provided_token = auth_data.get("token", "")
         if not verify_api_key(provided_token):
             logger.warning(f"WebSocket auth failed for client: {client_id}")
-            await manager.send_telemetry(client_id, TelemetryPayload(
-                status="ERROR",
-                percentage=0,
-                cycle=0,
-                atoms_lost=0,
-                n_vib=0,
-                fidelity=0,
-                decoder_backlog_ms=0,
-                timestamp=datetime.now().isoformat()
-            ))
+            await send_static_frame(websocket, _ERROR_FRAME)
             await websocket.close(code=4001, reason="Invalid API token")
             manager.disconnect(client_id)
             return
         
-        # Mark client as authenticated
-        manager.authenticate(client_id)
+        # Mark client as authenticated; JSON stays the default wire format
+        binary = auth_data.get("wire") == "binary"
+        manager.authenticate(client_id, binary=binary)
         
-        # Wait for benchmark command
+        # Wait for benchmark command and validate it (benchmark_type, cycles)
         data = await websocket.receive_json()
-        
-        # Validate benchmark_type from WebSocket message
-        raw_benchmark_type = data.get("benchmark_type", "velocity_fidelity")
         try:
-            benchmark_type = validate_benchmark_type(raw_benchmark_type)
-        except ValueError as e:
-            await manager.send_telemetry(client_id, TelemetryPayload(
-                status="ERROR",
-                percentage=0,
-                cycle=0,
-                atoms_lost=0,
-                n_vib=0,
-                fidelity=0,
-                decoder_backlog_ms=0,
-                timestamp=datetime.now().isoformat()
-            ))
-            logger.error(f"Invalid benchmark type from WebSocket: {e}")
+            cmd = BenchmarkCmd.model_validate(data)
+        except ValidationError as e:
+            await send_static_frame(websocket, _ERROR_FRAME, binary)
+            logger.error(f"Invalid benchmark command from WebSocket: {e.errors(include_url=False)}")
             manager.disconnect(client_id)
             return
         
-        # Validate cycles parameter
-        total_cycles = data.get("cycles", 50)
-        if not isinstance(total_cycles, int) or total_cycles < 1 or total_cycles > 1000:
-            total_cycles = 50
-        
         # Send initial telemetry
-        await manager.send_telemetry(client_id, TelemetryPayload(
-            status="CONNECTING",
-            percentage=0,
-            cycle=0,
-            atoms_lost=0,
-            n_vib=0,
-            fidelity=1.0,
-            decoder_backlog_ms=0,
-            timestamp=datetime.now().isoformat()
-        ))
+        await send_static_frame(websocket, _CONNECTING_FRAME, binary)
         
-        # Run simulation in background
-        await simulate_benchmark_execution(client_id, benchmark_type, total_cycles)
+        # Run simulation, then drain the telemetry queue before closing
+        await simulate_benchmark_execution(client_id, cmd.benchmark_type, cmd.cycles)
+        await manager.flush_telemetry(client_id)
+        manager.disconnect(client_id)
         
     except asyncio.TimeoutError:
         logger.warning(f"WebSocket auth timeout for client: {client_id}")
@@ -605,8 +850,6 @@ async def websocket_benchmark(websocket: WebSocket, client_id: str):
         logger.error(f"WebSocket error for {client_id}: {str(e)}")
         manager.disconnect(client_id)
 
-from fastapi import Header, Depends
-
 async def verify_api_key_header(x_api_key: str = Header(None, alias="X-API-Key")):
     """
     Dependency that validates API key from request header.
@@ -634,7 +877,7 @@ async def stop_benchmark(client_id: str):
     Retorna confirmación de la solicitud de parada.
     """
     # Validate client_id format
-    if not re.match(r'^[a-zA-Z0-9_\-]{1,64}$', client_id):
+    if not CLIENT_ID_PATTERN.fullmatch(client_id):
         raise HTTPException(status_code=400, detail="Invalid client ID format")
     
     manager.stop_benchmark(client_id)
@@ -652,65 +895,186 @@ async def run_benchmark(request: RunBenchmarkRequest):
     # benchmark_type is already validated by Pydantic validator
     benchmark_type = request.benchmark_type
     
+    # Only scripts found by the startup scan can be selected (prevents path traversal)
     script_name = f"benchmark_{benchmark_type}.py"
-    script_path = os.path.join(BENCHMARKS_DIR, script_name)
-    
-    # Verify the resolved path is within BENCHMARKS_DIR (prevent path traversal)
-    resolved_path = os.path.realpath(script_path)
-    benchmarks_real = os.path.realpath(BENCHMARKS_DIR)
-    if not resolved_path.startswith(benchmarks_real):
-        logger.error(f"Path traversal attempt detected: {script_path}")
-        raise HTTPException(status_code=400, detail="Invalid benchmark type")
-    
-    if not os.path.exists(script_path):
-        if benchmark_type == "full":
-            script_path = os.path.join(BENCHMARKS_DIR, "run_all_benchmarks.py")
-        else:
-            raise HTTPException(status_code=404, detail=f"Benchmark script not found")
+    if script_name in BENCHMARK_SCRIPTS:
+        script_path = os.path.join(BENCHMARKS_DIR, script_name)
+    elif benchmark_type == "full":
+        script_path = os.path.join(BENCHMARKS_DIR, "run_all_benchmarks.py")
+    else:
+        raise HTTPException(status_code=404, detail=f"Benchmark script not found")
 
     try:
         result_dir = os.path.join(BASE_DIR, "benchmark_results")
         
         logger.info(f"Running benchmark: {script_path}")
-        process = subprocess.run(
-            [PYTHON_EXE, script_path],
-            capture_output=True,
-            text=True,
-            check=False,
+        # Native async subprocess: the event loop keeps serving WebSocket
+        # telemetry while the benchmark runs
+        process = await asyncio.create_subprocess_exec(
+            PYTHON_EXE, script_path,
             cwd=BASE_DIR,
-            timeout=300  # 5 minute timeout to prevent hanging
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
         )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(),
+                timeout=300  # 5 minute timeout to prevent hanging
+            )
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
         
         if process.returncode != 0:
-            logger.error(f"Benchmark failed: {process.stderr}")
+            logger.error(f"Benchmark failed: {stderr.decode(errors='replace')}")
             
         json_file = os.path.join(result_dir, f"experiment_{benchmark_type[0]}_{benchmark_type}.json")
         if os.path.exists(json_file):
-            with open(json_file, 'r') as f:
-                data = json.load(f)
-            return data
+            # Stream the file as-is instead of parsing and re-serializing it
+            return FileResponse(json_file, media_type="application/json")
         
-        return {"status": "completed", "output": process.stdout}
+        return {"status": "completed", "output": stdout.decode(errors='replace')}
         
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         logger.error("Benchmark execution timed out")
         raise HTTPException(status_code=504, detail="Benchmark execution timed out")
     except Exception as e:
         logger.error(f"Error running benchmark: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+# ============================================================================
+# Favorites Store (in-memory cache, persisted off the event loop)
+# ============================================================================
+
+# Loaded from FAVORITES_FILE at startup; the in-memory list mirrors the log
+# afterwards, so reads never touch the disk again. Saves are written through
+# (in a worker thread) before they are acknowledged.
+# FAVORITES_FILE is an append-only JSON Lines log: a save appends one line
+# instead of rewriting the whole list, and a torn write only loses that line.
+_favorites_cache: Optional[List[Dict[str, Any]]] = None
+_fav_lock = asyncio.Lock()
+_fav_resync = False  # Set when a failed append may have left a partial line
+
+def _compact_favorites(favorites: List[Dict[str, Any]]) -> None:
+    """Rewrites the favorites log from a snapshot, atomically (blocking)."""
+    tmp_path = FAVORITES_FILE + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(b"".join(orjson.dumps(entry) + b"\n" for entry in favorites))
+    os.replace(tmp_path, FAVORITES_FILE)
+
+def _read_favorites() -> List[Dict[str, Any]]:
+    """
+    Reads the favorites log from disk (blocking).
+    
+    Migrates the legacy favorites.json array on first run, and compacts the
+    log if it contains unreadable lines (e.g. a save interrupted mid-write).
+    """
+    if not os.path.exists(FAVORITES_FILE):
+        if not os.path.exists(LEGACY_FAVORITES_FILE):
+            return []
+        with open(LEGACY_FAVORITES_FILE, 'rb') as f:
+            favorites = orjson.loads(f.read())
+        _compact_favorites(favorites)
+        logger.info(f"Migrated {len(favorites)} favorites to {FAVORITES_FILE}")
+        return favorites
+    
+    favorites = []
+    corrupt_lines = 0
+    with open(FAVORITES_FILE, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                favorites.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                corrupt_lines += 1
+    if corrupt_lines:
+        logger.warning(f"Dropped {corrupt_lines} unreadable favorites entries")
+        _compact_favorites(favorites)
+    return favorites
+
+def _append_favorites(entries: List[Dict[str, Any]]) -> None:
+    """Appends favorites to the log (blocking)."""
+    with open(FAVORITES_FILE, 'ab') as f:
+        f.write(b"".join(orjson.dumps(entry) + b"\n" for entry in entries))
+
+async def _get_favorites() -> List[Dict[str, Any]]:
+    """Returns the cached favorites list, reading it from disk if not loaded yet."""
+    global _favorites_cache
+    if _favorites_cache is None:
+        favorites = await asyncio.to_thread(_read_favorites)
+        # A concurrent request may have populated the cache while we awaited
+        if _favorites_cache is None:
+            _favorites_cache = favorites
+    return _favorites_cache
+
+async def _write_favorite(favorites: List[Dict[str, Any]], entry: Dict[str, Any]):
+    """
+    Persists a new favorite, then adds it to the cached list (call under _fav_lock).
+    
+    Raises if the write fails, leaving the cache unchanged.
+    """
+    global _fav_resync
+    try:
+        if _fav_resync:
+            # Rewrite the log atomically so a torn line from a failed append
+            # cannot swallow this entry
+            await asyncio.to_thread(_compact_favorites, favorites + [entry])
+            _fav_resync = False
+        else:
+            await asyncio.to_thread(_append_favorites, [entry])
+    except Exception:
+        _fav_resync = True
+        raise
+    favorites.append(entry)
+
+@app.on_event("startup")
+async def preload_favorites():
+    try:
+        await _get_favorites()
+    except Exception as e:
+        # Left unloaded; the first request retries
+        logger.error(f"Error loading favorites: {str(e)}")
+
 @app.get("/api/favorites/load", dependencies=[Depends(verify_api_key_header)])
 async def load_favorites():
-    if not os.path.exists(FAVORITES_FILE):
-        return []
     try:
-        with open(FAVORITES_FILE, 'r') as f:
-            return json.load(f)
+        return list(await _get_favorites())
     except Exception as e:
         logger.error(f"Error loading favorites: {str(e)}")
         return []
 
 
+# Crypto and QRAM benchmarks are deterministic, so their serialized results are
+# cached: crypto per year with a TTL (bounded, since 'year' is user input),
+# QRAM once. POST /api/benchmarks/cache/clear drops both.
+CRYPTO_CACHE_TTL_S = 300.0
+CRYPTO_CACHE_MAX_ENTRIES = 64
+_crypto_cache: Dict[int, Tuple[float, bytes]] = {}
+
+def _crypto_benchmark_json(year: int) -> bytes:
+    now = time.monotonic()
+    cached = _crypto_cache.get(year)
+    if cached is not None and now - cached[0] < CRYPTO_CACHE_TTL_S:
+        return cached[1]
+    payload = orjson.dumps(run_crypto_benchmark(target_year=year))
+    if len(_crypto_cache) >= CRYPTO_CACHE_MAX_ENTRIES:
+        _crypto_cache.clear()
+    _crypto_cache[year] = (now, payload)
+    return payload
+
+@lru_cache(maxsize=1)
+def _qram_benchmark_json() -> bytes:
+    return orjson.dumps(run_qram_benchmark())
+
+@app.post("/api/benchmarks/cache/clear", dependencies=[Depends(verify_api_key_header)])
+async def clear_benchmark_cache():
+    """Drops cached crypto/QRAM benchmark results."""
+    _crypto_cache.clear()
+    _qram_benchmark_json.cache_clear()
+    return {"status": "cleared"}
+
 @app.get("/api/benchmarks/crypto", dependencies=[Depends(verify_api_key_header)])
 async def get_crypto_benchmarks(year: int = 2026):
     """
@@ -718,7 +1082,7 @@ async def get_crypto_benchmarks(year: int = 2026):
     Uses 'year' parameter for hardware roadmap alignment.
     """
     try:
-        return run_crypto_benchmark(target_year=year)
+        return Response(content=_crypto_benchmark_json(year), media_type="application/json")
     except Exception as e:
         logger.error(f"Crypto benchmark failed: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -728,7 +1092,7 @@ async def get_crypto_benchmarks(year: int = 2026):
 async def get_qram_benchmarks():
     """Returns QRAM vs Angle Encoding cost analysis data."""
     try:
-        return run_qram_benchmark()
+        return Response(content=_qram_benchmark_json(), media_type="application/json")
     except Exception as e:
         logger.error(f"QRAM benchmark failed: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -759,17 +1123,49 @@ class OptimizationRequest(BaseModel):
     num_gates: int = 200
     width: int = 20
     height: int = 20
+    seed: Optional[int] = Field(default=None, ge=0, description="RNG seed; drawn per request when omitted")
+
+# CPU-bound optimizer runs go to worker processes so they never stall the
+# event loop (and the telemetry streams it serves). Created on first use with
+# the spawn start method: forking a process that runs the event loop (and
+# numba/BLAS threads) can deadlock the child.
+OPTIMIZER_MAX_WORKERS = max(1, int(os.getenv("OPTIMIZER_MAX_WORKERS", min(4, os.cpu_count() or 1))))
+_cpu_pool: Optional[ProcessPoolExecutor] = None
+
+def _get_cpu_pool() -> ProcessPoolExecutor:
+    global _cpu_pool
+    if _cpu_pool is None:
+        _cpu_pool = ProcessPoolExecutor(
+            max_workers=OPTIMIZER_MAX_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _cpu_pool
+
+@app.on_event("shutdown")
+def shutdown_cpu_pool():
+    if _cpu_pool is not None:
+        _cpu_pool.shutdown(wait=False, cancel_futures=True)
 
 @app.post("/api/topology/optimize", dependencies=[Depends(verify_api_key_header)])
 async def optimize_topology(request: OptimizationRequest):
     """
     Runs the Spectral-AOD topological optimizer.
-    Returns comparison of heating vs AOD complexity.
+    Returns comparison of heating vs AOD complexity, plus the seed used so a
+    run can be reproduced.
     """
+    seed = request.seed if request.seed is not None else secrets.randbits(63)
     try:
-        opt = SpectralAODRouter(request.width, request.height)
-        graph = opt.generate_random_circuit_graph(request.num_qubits, request.num_gates)
-        result = opt.optimize_mapping(graph)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            _get_cpu_pool(),
+            run_topology_optimization,
+            request.width,
+            request.height,
+            request.num_qubits,
+            request.num_gates,
+            seed
+        )
+        result["seed"] = seed
         return result
     except Exception as e:
         logger.error(f"Optimization failed: {str(e)}")
@@ -779,24 +1175,26 @@ async def optimize_topology(request: OptimizationRequest):
 @app.post("/api/favorites/save", dependencies=[Depends(verify_api_key_header)])
 async def save_favorite(config: ComparisonConfig):
     """Save a comparison configuration to favorites."""
-    favorites = await load_favorites()
-    
-    # Limit total favorites to prevent DoS
-    if len(favorites) >= 100:
-        raise HTTPException(status_code=400, detail="Maximum favorites limit reached (100)")
-    
-    if not config.id:
-        config.id = str(uuid.uuid4())
+    async with _fav_lock:
+        try:
+            favorites = await _get_favorites()
+        except Exception as e:
+            logger.error(f"Error loading favorites: {str(e)}")
+            raise HTTPException(status_code=500, detail="Failed to save favorite")
         
-    favorites.append(config.model_dump())
-    
-    try:
-        with open(FAVORITES_FILE, 'w') as f:
-            json.dump(favorites, f, indent=4)
+        # Limit total favorites to prevent DoS
+        if len(favorites) >= 100:
+            raise HTTPException(status_code=400, detail="Maximum favorites limit reached (100)")
+        
+        if not config.id:
+            config.id = str(uuid.uuid4())
+            
+        try:
+            await _write_favorite(favorites, config.model_dump())
+        except Exception as e:
+            logger.error(f"Error writing favorites: {str(e)}")
+            raise HTTPException(status_code=500, detail="Failed to save favorite")
         return {"status": "success", "id": config.id}
-    except Exception as e:
-        logger.error(f"Error saving favorite: {str(e)}")
-        raise HTTPException(status_code=500, detail="Failed to save favorite")
 
 # ============================================================================
 # HPC-Bridge Export Endpoints
@@ -834,4 +1232,15 @@ async def export_qasm3(request: ExportRequest):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Telemetry batches repeat the same keys every frame, so permessage-deflate
+    # shrinks them several-fold on the wire. Clients negotiate it on upgrade.
+    # loop/http default to "auto", which picks uvloop/httptools when installed.
+    # Connection state and the favorites cache are per process, so a single
+    # worker is the default (WEB_CONCURRENCY overrides it).
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        ws_per_message_deflate=True
+    )
@@ -0,0 +1,139 @@
+"""
+Validator Microbenchmarks
+=========================
+
+Benchmarks de pytest-benchmark para las rutas críticas del validador:
+- Geometría de un registro de 256 átomos (sin y con caché)
+- Shuttle con muchos átomos AOD
+- Validación por lotes (validate_jobs)
+
+El nombre del fichero no sigue el patrón test_*.py, así que `pytest tests/`
+no lo recoge. Ejecutar explícitamente:
+
+    pytest tests/bench_validator.py --benchmark-only
+
+Cada benchmark guarda el pico de memoria (tracemalloc) de una llamada en
+`extra_info["peak_bytes"]`.
+"""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from drivers.neutral_atom.schema import (
+    TRAP_ROLE_CODES,
+    TrapRole,
+    NeutralAtomRegister,
+    ShuttleMove,
+    Measurement,
+    DeviceConfig,
+    NeutralAtomJob,
+)
+from drivers.neutral_atom.validator import PulserValidator
+
+
+pytestmark = pytest.mark.benchmark(group="validator")
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+@pytest.fixture(scope="module")
+def validator():
+    """Instancia del validador."""
+    return PulserValidator()
+
+
+@pytest.fixture(scope="module")
+def large_register():
+    """Rejilla AOD 16x16 (256 átomos, 5 µm) con una colisión en la esquina."""
+    i = np.arange(256)
+    xy = np.column_stack((i % 16 * 5.0, i // 16 * 5.0))
+    xy[1] = (2.0, 0.0)  # Colisión con el átomo 0
+    return NeutralAtomRegister.from_arrays(
+        xy,
+        roles=np.full(256, TRAP_ROLE_CODES[TrapRole.AOD]),
+        aod_rows=i // 16,
+        aod_cols=i % 16,
+    )
+
+
+def make_job(register, operations):
+    """Helper para crear jobs."""
+    return NeutralAtomJob(
+        device=DeviceConfig(backend_id="simulator"),
+        register=register,
+        operations=operations
+    )
+
+
+def record_peak_bytes(benchmark, func, *args):
+    """Guarda en extra_info el pico de memoria de una llamada a func."""
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_bytes"] = peak
+
+
+# =============================================================================
+# BENCHMARKS
+# =============================================================================
+
+def test_bench_collision(benchmark, validator, large_register):
+    """Geometría de 256 átomos sin caché de registro."""
+    job = make_job(large_register, [Measurement(start_time=0, atom_ids=[0, 1])])
+    clear = PulserValidator._cached_register_check.cache_clear
+
+    clear()
+    record_peak_bytes(benchmark, validator.validate, job)
+    result = benchmark.pedantic(validator.validate, args=(job,), setup=clear, rounds=50)
+
+    assert not result.is_valid
+
+
+def test_bench_collision_cached(benchmark, validator, large_register):
+    """Geometría de 256 átomos con el resultado del registro en caché."""
+    job = make_job(large_register, [Measurement(start_time=0, atom_ids=[0, 1])])
+
+    validator.validate(job)
+    record_peak_bytes(benchmark, validator.validate, job)
+    result = benchmark(validator.validate, job)
+
+    assert not result.is_valid
+
+
+def test_bench_shuttle(benchmark, validator, large_register):
+    """Shuttle de una fila completa (16 átomos AOD) sobre el registro grande."""
+    row = list(range(240, 256))
+    move = ShuttleMove(
+        atom_ids=row,
+        start_time=0,
+        duration=50000,
+        target_positions=[(k * 5.0, 76.0) for k in range(16)],
+    )
+    job = make_job(large_register, [move, Measurement(start_time=60000, atom_ids=row)])
+
+    record_peak_bytes(benchmark, validator.validate, job)
+    result = benchmark(validator.validate, job)
+
+    assert result.total_movement_distance == pytest.approx(16.0)
+
+
+def test_bench_validate_jobs(benchmark, validator, large_register):
+    """Lote de 32 jobs sobre el mismo registro."""
+    jobs = [
+        make_job(large_register, [Measurement(start_time=0, atom_ids=[k])])
+        for k in range(32)
+    ]
+
+    record_peak_bytes(benchmark, validator.validate_jobs, jobs)
+    results = benchmark(validator.validate_jobs, jobs)
+
+    assert len(results) == 32
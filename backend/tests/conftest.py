@@ -0,0 +1,32 @@
+"""
+Shared pytest fixtures for the backend test suite.
+"""
+
+import os
+import random
+from pathlib import Path
+
+import pytest
+
+# Keep compiled numba kernels in one place so repeated runs (and CI caches)
+# reuse them; must be set before the kernels are imported. Each pytest-xdist
+# worker (PYTEST_XDIST_WORKER=gw0, gw1, ...) gets its own subdirectory; the
+# workers inherit the controller's environment, so our own default is
+# overridden per process while a user-provided NUMBA_CACHE_DIR is kept.
+_NUMBA_CACHE_ROOT = str(Path(__file__).resolve().parents[1] / ".numba_cache")
+if os.environ.get("NUMBA_CACHE_DIR", _NUMBA_CACHE_ROOT).startswith(_NUMBA_CACHE_ROOT):
+    os.environ["NUMBA_CACHE_DIR"] = os.path.join(
+        _NUMBA_CACHE_ROOT, os.environ.get("PYTEST_XDIST_WORKER", "main")
+    )
+
+
+@pytest.fixture(scope="session")
+def large_circuit_graph():
+    """200-qubit / 1000-gate circuit graph (seed 42), built once per session."""
+    # Imported here so suites that never use the optimizer (schema, validator)
+    # do not pay for importing networkx
+    from optimizer import SpectralAODRouter
+    
+    router = SpectralAODRouter(width=50, height=50)
+    random.seed(42)
+    return router.generate_random_circuit_graph(num_qubits=200, num_gates=1000)
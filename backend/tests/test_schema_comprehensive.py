@@ -16,10 +16,13 @@ Fecha: Febrero 2026
 import pytest
 from pydantic import ValidationError
 import math
+import numpy as np
 
 from drivers.neutral_atom.schema import (
     # Enums
     TrapRole,
+    TRAP_ROLE_CODES,
+    ZONE_TYPE_CODES,
     WaveformType,
     LayoutType,
     ZoneType,
@@ -137,6 +140,12 @@ class TestAtomPosition:
         atom = AtomPosition(id=0, x=1.23456789, y=-9.87654321)
         assert abs(atom.x - 1.23456789) < 1e-9
         assert abs(atom.y - (-9.87654321)) < 1e-9
+    
+    def test_atom_is_frozen(self):
+        """AtomPosition es inmutable (frozen)."""
+        atom = AtomPosition(id=0, x=0.0, y=0.0)
+        with pytest.raises(ValidationError):
+            atom.x = 5.0
 
 
 # =============================================================================
@@ -316,17 +325,43 @@ class TestNeutralAtomRegister:
     
     def test_max_atoms(self):
         """Máximo 256 átomos."""
-        atoms = [AtomPosition(id=i, x=float(i % 16 * 5), y=float(i // 16 * 5)) 
-                 for i in range(256)]
-        reg = NeutralAtomRegister(atoms=atoms)
+        i = np.arange(256)
+        reg = NeutralAtomRegister.from_arrays(np.column_stack((i % 16 * 5.0, i // 16 * 5.0)))
         assert len(reg.atoms) == 256
     
     def test_too_many_atoms_fail(self):
         """Más de 256 átomos debe fallar."""
-        atoms = [AtomPosition(id=i, x=float(i % 16 * 5), y=float(i // 16 * 5)) 
-                 for i in range(257)]
+        i = np.arange(257)
+        with pytest.raises(ValidationError):
+            NeutralAtomRegister.from_arrays(np.column_stack((i % 16 * 5.0, i // 16 * 5.0)))
+    
+    def test_from_arrays(self):
+        """from_arrays equivale a construir cada AtomPosition con validación."""
+        reg = NeutralAtomRegister.from_arrays(
+            np.array([[0.0, 0.0], [5.0, 0.0]]),
+            roles=np.array([TRAP_ROLE_CODES[TrapRole.SLM], TRAP_ROLE_CODES[TrapRole.AOD]]),
+            ids=np.array([3, 8]),
+            aod_rows=np.array([-1, 2]),
+            aod_cols=np.array([-1, 1]),
+            blockade_radius=10.0,
+        )
+        assert reg.atoms == [
+            AtomPosition(id=3, x=0.0, y=0.0),
+            AtomPosition(id=8, x=5.0, y=0.0, role=TrapRole.AOD, aod_row=2, aod_col=1),
+        ]
+        assert reg.blockade_radius == 10.0
         with pytest.raises(ValidationError):
-            NeutralAtomRegister(atoms=atoms)
+            NeutralAtomRegister.from_arrays(np.zeros((2, 2)), ids=np.array([1, 1]))
+    
+    def test_from_grid(self):
+        """from_grid coloca los átomos en rejilla, fila a fila desde el origen."""
+        line = NeutralAtomRegister.from_grid(5, spacing=6.0)
+        assert line.atoms == [AtomPosition(id=i, x=6.0 * i, y=0.0) for i in range(5)]
+        
+        grid = NeutralAtomRegister.from_grid(6, spacing=5.0, role=TrapRole.AOD, cols=3)
+        assert grid.xy.tolist() == [[0.0, 0.0], [5.0, 0.0], [10.0, 0.0],
+                                    [0.0, 5.0], [5.0, 5.0], [10.0, 5.0]]
+        assert grid.get_aod_atoms() == grid.atoms
     
     def test_get_atom_by_id(self, two_atom_register):
         """Buscar átomo por ID."""
@@ -370,6 +405,24 @@ class TestNeutralAtomRegister:
         no_zone = reg.get_zone_at_position(100.0, 100.0)
         assert no_zone is None
     
+    def test_get_zone_at_position_overlapping_zones(self):
+        """Con zonas solapadas gana la primera; reasignar zones refresca la rejilla."""
+        zones = [
+            ZoneDefinition(zone_id="small", zone_type=ZoneType.ENTANGLEMENT,
+                           x_min=0.0, x_max=5.0, y_min=0.0, y_max=5.0),
+            ZoneDefinition(zone_id="big", zone_type=ZoneType.STORAGE,
+                           x_min=-50.0, x_max=50.0, y_min=-50.0, y_max=50.0),
+        ]
+        reg = NeutralAtomRegister(atoms=[AtomPosition(id=0, x=0.0, y=0.0)], zones=zones)
+        assert reg.get_zone_at_position(5.0, 5.0).zone_id == "small"
+        assert reg.get_zone_at_position(-40.0, 30.0).zone_id == "big"
+        assert reg.get_zone_at_position(60.0, 0.0) is None
+        assert reg.zone_bounds.tolist() == [[0.0, 5.0, 0.0, 5.0], [-50.0, 50.0, -50.0, 50.0]]
+        
+        reg.zones = zones[1:]
+        assert reg.get_zone_at_position(1.0, 1.0).zone_id == "big"
+        assert reg.zone_bounds.shape == (1, 4)
+    
     def test_get_zones_by_type(self):
         """Filtrar zonas por tipo."""
         reg = NeutralAtomRegister(
@@ -391,10 +444,57 @@ class TestNeutralAtomRegister:
         )
         storage_zones = reg.get_zones_by_type(ZoneType.STORAGE)
         assert len(storage_zones) == 2
+        assert [z.zone_id for z in storage_zones] == ["s1", "s2"]
+        assert reg.zone_types_arr.tolist() == [
+            ZONE_TYPE_CODES[ZoneType.STORAGE],
+            ZONE_TYPE_CODES[ZoneType.ENTANGLEMENT],
+            ZONE_TYPE_CODES[ZoneType.STORAGE],
+        ]
         
         entangle_zones = reg.get_zones_by_type(ZoneType.ENTANGLEMENT)
         assert len(entangle_zones) == 1
 
+    def test_soa_arrays(self):
+        """Vistas SoA (xy, roles, filas/columnas AOD) en el orden de atoms."""
+        reg = NeutralAtomRegister(atoms=[
+            AtomPosition(id=0, x=0.0, y=1.0, role=TrapRole.SLM),
+            AtomPosition(id=1, x=5.0, y=2.0, role=TrapRole.AOD, aod_row=3, aod_col=4),
+        ])
+        assert reg.xy.shape == (2, 2)
+        assert reg.xy.tolist() == [[0.0, 1.0], [5.0, 2.0]]
+        assert reg.roles_arr.tolist() == [TRAP_ROLE_CODES[TrapRole.SLM], TRAP_ROLE_CODES[TrapRole.AOD]]
+        assert reg.aod_rows.tolist() == [-1, 3]
+        assert reg.aod_cols.tolist() == [-1, 4]
+        assert not reg.xy.flags.writeable
+
+    def test_id_lookup(self):
+        """get_atom_by_id funciona con IDs no ordenados."""
+        reg = NeutralAtomRegister(atoms=[
+            AtomPosition(id=9, x=0.0, y=0.0, role=TrapRole.SLM),
+            AtomPosition(id=2, x=5.0, y=0.0, role=TrapRole.AOD, aod_row=1, aod_col=2),
+            AtomPosition(id=4, x=10.0, y=0.0, role=TrapRole.SLM),
+        ])
+        assert reg.ids.tolist() == [9, 2, 4]
+        assert reg.get_atom_by_id(4).x == 10.0
+        assert reg.get_atom_by_id(9).x == 0.0
+        assert reg.get_atom_by_id(3) is None
+        assert [a.id for a in reg.get_slm_atoms()] == [9, 4]
+
+    def test_soa_arrays_refresh_on_reassign(self, two_atom_register):
+        """Reasignar atoms (o model_copy con update) invalida las vistas SoA."""
+        assert two_atom_register.xy.shape == (2, 2)
+        copy = two_atom_register.model_copy(update={"atoms": [AtomPosition(id=7, x=9.0, y=9.0)]})
+        assert copy.xy.tolist() == [[9.0, 9.0]]
+
+        two_atom_register.atoms = [AtomPosition(id=5, x=1.0, y=2.0)]
+        assert two_atom_register.xy.tolist() == [[1.0, 2.0]]
+    
+    def test_equality_ignores_cached_arrays(self, two_atom_register):
+        """La igualdad compara campos, no las vistas NumPy en caché."""
+        other = two_atom_register.model_copy(deep=True)
+        two_atom_register.xy, other.xy
+        assert two_atom_register == other
+
 
 # =============================================================================
 # OPERATION TESTS
@@ -475,6 +575,16 @@ class TestOperations:
             mode="deactivate"
         )
         assert shield.mode == "deactivate"
+    
+    def test_operations_are_frozen(self, valid_waveform):
+        """Las operaciones son inmutables (frozen) y las sin listas, hashables."""
+        gate = RydbergGate(control_atom=0, target_atom=1, start_time=0)
+        pulse = GlobalPulse(start_time=0, omega=valid_waveform)
+        with pytest.raises(ValidationError):
+            gate.start_time = 100
+        with pytest.raises(ValidationError):
+            pulse.phase = 1.0
+        assert hash(gate) == hash(RydbergGate(control_atom=0, target_atom=1, start_time=0))
 
 
 # =============================================================================
@@ -534,6 +644,29 @@ class TestNeutralAtomJob:
         )
         assert job.register.zones is not None
         assert any(isinstance(op, ShieldingEvent) for op in job.operations)
+    
+    def test_operations_by_start(self, two_atom_register, valid_waveform):
+        """Operaciones ordenadas por start_time una sola vez (orden estable)."""
+        pulse = GlobalPulse(start_time=0, omega=valid_waveform)
+        gate = RydbergGate(control_atom=0, target_atom=1, gate_type="CZ", start_time=1500)
+        early = Measurement(start_time=1500, atom_ids=[0])
+        late = Measurement(start_time=2500, atom_ids=[0, 1])
+        job = NeutralAtomJob(
+            device=DeviceConfig(backend_id="simulator"),
+            register=two_atom_register,
+            operations=[late, gate, pulse, early]
+        )
+        
+        assert job.operations_by_start == [pulse, gate, early, late]
+        assert job.timeline.starts.tolist() == [0.0, 1500.0, 1500.0, 2500.0]
+        assert job.timeline.ends[0] == valid_waveform.duration
+        assert job.get_total_duration() == 2500.0
+        
+        # Reasignar operations invalida la línea temporal
+        job.operations = [pulse]
+        assert job.operations_by_start == [pulse]
+        assert job.get_total_duration() == valid_waveform.duration
+        assert job.model_copy(update={"operations": [late]}).get_total_duration() == 2500.0
 
 
 # =============================================================================
@@ -20,6 +20,7 @@ import math
 from drivers.neutral_atom.schema import (
     AtomPosition,
     TrapRole,
+    LayoutType,
     WaveformSpec,
     WaveformType,
     ZoneDefinition,
@@ -36,6 +37,7 @@ from drivers.neutral_atom.schema import (
 
 from drivers.neutral_atom.validator import (
     PulserValidator,
+    get_default_validator,
     validate_job,
     ValidationResult,
     ValidationWarning,
@@ -52,13 +54,15 @@ from drivers.neutral_atom.validator import (
 # FIXTURES
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def validator():
-    """Instancia del validador."""
-    return PulserValidator()
+    """Instancia del validador (sin estado mutable: se comparte en la sesión)."""
+    return get_default_validator()
 
 
-@pytest.fixture
+# Read-only inputs: no test mutates them, so each is built once per module
+
+@pytest.fixture(scope="module")
 def basic_register():
     """Registro básico con dos átomos."""
     return NeutralAtomRegister(
@@ -69,7 +73,7 @@ def basic_register():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def aod_register():
     """Registro con átomos móviles AOD."""
     return NeutralAtomRegister(
@@ -81,7 +85,7 @@ def aod_register():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def zoned_register():
     """Registro con arquitectura zonal."""
     return NeutralAtomRegister(
@@ -113,7 +117,7 @@ def zoned_register():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def valid_pulse():
     """Pulso Rydberg válido."""
     return GlobalPulse(
@@ -146,7 +150,7 @@ class TestCollisionDetection:
         result = validator.validate(job)
         
         assert result.is_valid
-        collision_errors = [e for e in result.errors if isinstance(e, CollisionError)]
+        collision_errors = result.get(CollisionError)
         assert len(collision_errors) == 0
     
     def test_collision_detected(self, validator):
@@ -161,7 +165,7 @@ class TestCollisionDetection:
         result = validator.validate(job)
         
         assert not result.is_valid
-        collision_errors = [e for e in result.errors if isinstance(e, CollisionError)]
+        collision_errors = result.get(CollisionError)
         assert len(collision_errors) >= 1
     
     def test_exactly_at_min_distance(self, validator):
@@ -177,7 +181,7 @@ class TestCollisionDetection:
         result = validator.validate(job)
         
         # Should be valid (at limit, not below)
-        collision_errors = [e for e in result.errors if isinstance(e, CollisionError)]
+        collision_errors = result.get(CollisionError)
         assert len(collision_errors) == 0
     
     def test_near_collision_warning(self, validator):
@@ -192,10 +196,57 @@ class TestCollisionDetection:
         job = make_job(register, [Measurement(start_time=0, atom_ids=[0, 1])])
         result = validator.validate(job)
         
-        near_collision = [w for w in result.warnings if w.code == "NEAR_COLLISION"]
+        near_collision = result.warnings_with_code("NEAR_COLLISION")
         # May or may not generate warning depending on threshold
         assert result.is_valid
 
+    @pytest.mark.parametrize("side", [8, 14])
+    def test_collision_detected_large_register(self, validator, side):
+        """Registros medianos (pdist) y grandes (k-d tree) detectan la misma colisión."""
+        n = side * side
+        last = n - 1
+        atoms = [
+            AtomPosition(id=i, x=5.0 * (i % side), y=5.0 * (i // side))
+            for i in range(n)
+        ]
+        atoms[last] = AtomPosition(id=last, x=2.5, y=0.0)  # 2.5 µm de los átomos 0 y 1
+        register = NeutralAtomRegister(atoms=atoms)
+        job = make_job(register, [Measurement(start_time=0, atom_ids=[0])])
+        result = validator.validate(job)
+
+        collision_errors = result.get(CollisionError)
+        assert len(collision_errors) == 2  # Último átomo vs átomos 0 y 1
+        assert f"Atoms 0 and {last}" in str(collision_errors[0])
+        assert f"Atoms 1 and {last}" in str(collision_errors[1])
+
+
+    @pytest.mark.parametrize("layout", [LayoutType.RECTANGULAR, LayoutType.TRIANGULAR])
+    def test_lattice_layout_skips_pair_search(self, validator, layout):
+        """Una red regular declarada con paso suficiente evita la búsqueda de pares."""
+        h = 5.0 * math.sqrt(3) / 2
+        atoms = [
+            AtomPosition(
+                id=r * 8 + c,
+                x=5.0 * c + (2.5 * (r % 2) if layout == LayoutType.TRIANGULAR else 0.0),
+                y=(h if layout == LayoutType.TRIANGULAR else 5.0) * r,
+            )
+            for r in range(8) for c in range(8)
+        ]
+        register = NeutralAtomRegister(atoms=atoms, layout_type=layout)
+        result = validator.validate(make_job(register, [Measurement(start_time=0, atom_ids=[0])]))
+        
+        assert result.specialization_used == layout.value
+        assert result.is_valid
+
+    def test_off_lattice_layout_uses_pair_search(self, validator):
+        """Si los átomos no están en la red declarada, se usa la búsqueda normal."""
+        atoms = [AtomPosition(id=i, x=5.0 * (i % 8), y=5.0 * (i // 8)) for i in range(63)]
+        atoms.append(AtomPosition(id=63, x=2.5, y=0.0))  # Fuera de la red, colisiona
+        register = NeutralAtomRegister(atoms=atoms, layout_type=LayoutType.RECTANGULAR)
+        result = validator.validate(make_job(register, [Measurement(start_time=0, atom_ids=[0])]))
+        
+        assert result.specialization_used is None
+        assert len(result.get(CollisionError)) == 2
 
 # =============================================================================
 # VELOCITY LIMIT TESTS
@@ -216,7 +267,7 @@ class TestVelocityLimits:
         job = make_job(aod_register, [move])
         result = validator.validate(job)
         
-        velocity_errors = [e for e in result.errors if isinstance(e, VelocityExceededError)]
+        velocity_errors = result.get(VelocityExceededError)
         assert len(velocity_errors) == 0
     
     def test_velocity_exceeded(self, validator, aod_register):
@@ -232,7 +283,7 @@ class TestVelocityLimits:
         result = validator.validate(job)
         
         assert not result.is_valid
-        velocity_errors = [e for e in result.errors if isinstance(e, VelocityExceededError)]
+        velocity_errors = result.get(VelocityExceededError)
         assert len(velocity_errors) >= 1
     
     def test_marginal_velocity(self, validator, aod_register):
@@ -248,7 +299,7 @@ class TestVelocityLimits:
         job = make_job(aod_register, [move])
         result = validator.validate(job)
         
-        velocity_errors = [e for e in result.errors if isinstance(e, VelocityExceededError)]
+        velocity_errors = result.get(VelocityExceededError)
         assert len(velocity_errors) == 0
 
 
@@ -272,7 +323,7 @@ class TestTopologicalConstraints:
         job = make_job(aod_register, [move])
         result = validator.validate(job)
         
-        topo_errors = [e for e in result.errors if isinstance(e, TopologicalViolationError)]
+        topo_errors = result.get(TopologicalViolationError)
         assert len(topo_errors) == 0
     
     def test_row_crossing_detected(self, validator):
@@ -294,7 +345,7 @@ class TestTopologicalConstraints:
         job = make_job(register, [move])
         result = validator.validate(job)
         
-        topo_errors = [e for e in result.errors if isinstance(e, TopologicalViolationError)]
+        topo_errors = result.get(TopologicalViolationError)
         assert len(topo_errors) >= 1
     
     def test_column_crossing_detected(self, validator):
@@ -316,9 +367,69 @@ class TestTopologicalConstraints:
         job = make_job(register, [move])
         result = validator.validate(job)
         
-        topo_errors = [e for e in result.errors if isinstance(e, TopologicalViolationError)]
+        topo_errors = result.get(TopologicalViolationError)
         assert len(topo_errors) >= 1
-    
+
+    def test_crossing_uses_current_positions(self, validator):
+        """El orden se evalúa sobre las posiciones tras los shuttles previos."""
+        register = NeutralAtomRegister(
+            atoms=[
+                AtomPosition(id=0, x=0.0, y=0.0, role=TrapRole.AOD, aod_row=0, aod_col=0),
+                AtomPosition(id=1, x=0.0, y=10.0, role=TrapRole.AOD, aod_row=1, aod_col=0),
+            ]
+        )
+        # Atom 1 moves up first, so atom 0 may then pass its initial y
+        job = make_job(register, [
+            ShuttleMove(atom_ids=[1], start_time=0, duration=50000,
+                        target_positions=[(0.0, 20.0)], trajectory="minimum_jerk"),
+            ShuttleMove(atom_ids=[0], start_time=60000, duration=50000,
+                        target_positions=[(0.0, 15.0)], trajectory="minimum_jerk"),
+        ])
+        result = validator.validate(job)
+
+        assert result.get(TopologicalViolationError) == []
+
+    def test_same_row_reordering_allowed(self, validator):
+        """Átomos de la misma fila AOD pueden invertir su orden vertical."""
+        register = NeutralAtomRegister(
+            atoms=[
+                AtomPosition(id=0, x=0.0, y=0.0, role=TrapRole.AOD, aod_row=0, aod_col=0),
+                AtomPosition(id=1, x=10.0, y=2.0, role=TrapRole.AOD, aod_row=0, aod_col=1),
+            ]
+        )
+        move = ShuttleMove(
+            atom_ids=[0],
+            start_time=0,
+            duration=50000,
+            target_positions=[(0.0, 5.0)],  # y order flips, rows are equal
+            trajectory="minimum_jerk"
+        )
+        job = make_job(register, [move])
+        result = validator.validate(job)
+
+        assert result.get(TopologicalViolationError) == []
+
+    def test_atoms_without_grid_are_ignored(self, validator):
+        """Átomos AOD sin aod_row/aod_col no participan en la comprobación."""
+        register = NeutralAtomRegister(
+            atoms=[
+                AtomPosition(id=0, x=0.0, y=0.0, role=TrapRole.AOD),
+                AtomPosition(id=1, x=0.0, y=10.0, role=TrapRole.AOD, aod_row=1, aod_col=0),
+            ]
+        )
+        move = ShuttleMove(
+            atom_ids=[0],
+            start_time=0,
+            duration=50000,
+            target_positions=[(0.0, 15.0)],
+            trajectory="minimum_jerk"
+        )
+        job = make_job(register, [move])
+        result = validator.validate(job)
+
+        assert result.get(TopologicalViolationError) == []
+        assert "MISSING_AOD_GRID" in result.warnings_by_code
+
     def test_slm_atom_cannot_shuttle(self, validator):
         """Átomos SLM no deberían poder moverse."""
         register = NeutralAtomRegister(
@@ -356,7 +467,7 @@ class TestRydbergGateValidation:
         job = make_job(basic_register, [gate])
         result = validator.validate(job)
         
-        blockade_errors = [e for e in result.errors if isinstance(e, BlockadeDistanceError)]
+        blockade_errors = result.get(BlockadeDistanceError)
         assert len(blockade_errors) == 0
     
     def test_atoms_too_far_for_blockade(self, validator):
@@ -378,7 +489,7 @@ class TestRydbergGateValidation:
         result = validator.validate(job)
         
         assert not result.is_valid
-        blockade_errors = [e for e in result.errors if isinstance(e, BlockadeDistanceError)]
+        blockade_errors = result.get(BlockadeDistanceError)
         assert len(blockade_errors) >= 1
     
     def test_marginal_blockade_warning(self, validator):
@@ -395,9 +506,31 @@ class TestRydbergGateValidation:
         result = validator.validate(job)
         
         # Should be valid but may have warning
-        blockade_errors = [e for e in result.errors if isinstance(e, BlockadeDistanceError)]
+        blockade_errors = result.get(BlockadeDistanceError)
         assert len(blockade_errors) == 0
 
+    @pytest.mark.parametrize("blockade, min_dist, x, y, weak", [
+        (10.0, 4.0, 2.373631541739761, 9.714209865143852, True),   # dist == blockade
+        (10.0, 4.0, 8.434945114754745, 3.138741931264032, False),  # dist == 0.9 * blockade
+        (8.0, 4.1, 4.0636186253047, 0.5449804290767989, False),    # dist == min_atom_distance
+    ])
+    def test_gate_limits_are_exact(self, validator, blockade, min_dist, x, y, weak):
+        """Pares justo en los límites: el redondeo de d² no cambia el resultado."""
+        register = NeutralAtomRegister(
+            blockade_radius=blockade,
+            min_atom_distance=min_dist,
+            atoms=[
+                AtomPosition(id=0, x=0.0, y=0.0),
+                AtomPosition(id=1, x=x, y=y),
+            ]
+        )
+        assert math.hypot(x, y) in (blockade, 0.9 * blockade, min_dist)
+        gate = RydbergGate(control_atom=0, target_atom=1, gate_type="CZ", start_time=0)
+        result = validator.validate(make_job(register, [gate]))
+
+        assert result.is_valid
+        assert bool(result.warnings_with_code("WEAK_BLOCKADE")) is weak
+
 
 # =============================================================================
 # ZONE VALIDATION TESTS (v2.1)
@@ -424,8 +557,7 @@ class TestZoneValidation:
         ])
         result = validator.validate(job)
         
-        shielded_warnings = [w for w in result.warnings 
-                            if w.code == "PULSE_IN_SHIELDED_ZONE"]
+        shielded_warnings = result.warnings_with_code("PULSE_IN_SHIELDED_ZONE")
         assert len(shielded_warnings) >= 1
         assert shielded_warnings[0].severity == "high"
     
@@ -437,8 +569,7 @@ class TestZoneValidation:
         ])
         result = validator.validate(job)
         
-        readout_warnings = [w for w in result.warnings 
-                          if w.code == "MEASUREMENT_OUTSIDE_READOUT"]
+        readout_warnings = result.warnings_with_code("MEASUREMENT_OUTSIDE_READOUT")
         assert len(readout_warnings) >= 1
     
     def test_entanglement_zone_allows_gates(self, validator):
@@ -546,9 +677,55 @@ class TestTemporalOverlaps:
         job = make_job(aod_register, [move1, move2])
         result = validator.validate(job)
         
-        concurrent_warnings = [w for w in result.warnings 
-                              if w.code == "CONCURRENT_SHUTTLES"]
+        concurrent_warnings = result.warnings_with_code("CONCURRENT_SHUTTLES")
         assert len(concurrent_warnings) >= 1
+        # Las trayectorias (x=0..5, y=0) y (x=0, y=5..10) no se cruzan
+        assert not result.warnings_with_code("SPATIAL_SHUTTLE_CROSSING")
+    
+    def test_crossing_trajectories_warning(self, validator, aod_register):
+        """Shuttles concurrentes con trayectorias que se cruzan generan warning."""
+        move1 = ShuttleMove(
+            atom_ids=[2],
+            start_time=0,
+            duration=20000,
+            target_positions=[(5.0, 10.0)],  # (5, 0) -> (5, 10)
+            trajectory="minimum_jerk"
+        )
+        move2 = ShuttleMove(
+            atom_ids=[1],
+            start_time=10000,
+            duration=20000,
+            target_positions=[(10.0, 5.0)],  # (0, 5) -> (10, 5), cruza en (5, 5)
+            trajectory="minimum_jerk"
+        )
+        job = make_job(aod_register, [move1, move2])
+        result = validator.validate(job)
+        
+        crossing_warnings = result.warnings_with_code("SPATIAL_SHUTTLE_CROSSING")
+        assert len(crossing_warnings) == 1
+        assert crossing_warnings[0].operation_index == 1
+
+    def test_parallel_diagonals_do_not_cross(self, validator, aod_register):
+        """Cajas que se tocan pero segmentos paralelos: sin warning de cruce."""
+        move1 = ShuttleMove(
+            atom_ids=[1],
+            start_time=0,
+            duration=20000,
+            target_positions=[(5.0, 10.0)],  # (0, 5) -> (5, 10)
+            trajectory="minimum_jerk"
+        )
+        move2 = ShuttleMove(
+            atom_ids=[2],
+            start_time=10000,
+            duration=20000,
+            target_positions=[(10.0, 5.0)],  # (5, 0) -> (10, 5)
+            trajectory="minimum_jerk"
+        )
+        job = make_job(aod_register, [move1, move2])
+        result = validator.validate(job)
+        
+        assert result.warnings_with_code("CONCURRENT_SHUTTLES")
+        assert not result.warnings_with_code("SPATIAL_SHUTTLE_CROSSING")
 
 
 # =============================================================================
@@ -560,12 +737,7 @@ class TestValidatorIntegration:
     
     def test_complex_valid_job(self, validator):
         """Job complejo pero válido."""
-        register = NeutralAtomRegister(
-            atoms=[
-                AtomPosition(id=i, x=float(i * 6), y=0.0, role=TrapRole.SLM)
-                for i in range(5)
-            ]
-        )
+        register = NeutralAtomRegister.from_grid(5, spacing=6.0)
         job = make_job(register, [
             GlobalPulse(
                 start_time=0,
@@ -589,6 +761,101 @@ class TestValidatorIntegration:
         
         assert isinstance(result, ValidationResult)
         assert result.is_valid
+    
+    def test_default_validator_is_shared(self):
+        """get_default_validator devuelve una instancia por valor de strict."""
+        assert get_default_validator() is get_default_validator(True)
+        assert get_default_validator(False) is not get_default_validator(True)
+        assert get_default_validator(False).strict_mode is False
+    
+    def test_validate_jobs_matches_validate(self, validator, basic_register):
+        """validate_jobs da el mismo resultado que validate() job a job."""
+        crowded = NeutralAtomRegister(
+            atoms=[
+                AtomPosition(id=0, x=0.0, y=0.0),
+                AtomPosition(id=1, x=2.0, y=0.0),  # Colisión
+                AtomPosition(id=2, x=6.3, y=0.0),  # Casi colisión
+            ]
+        )
+        jobs = [
+            make_job(basic_register, [Measurement(start_time=0, atom_ids=[0, 1])]),
+            make_job(crowded, [Measurement(start_time=0, atom_ids=[0, 1, 2])]),
+        ]
+        
+        batch = validator.validate_jobs(jobs)
+        
+        assert len(batch) == 2
+        for job, result in zip(jobs, batch):
+            single = validator.validate(job)
+            assert [str(e) for e in result.errors] == [str(e) for e in single.errors]
+            assert [w.message for w in result.warnings] == [w.message for w in single.warnings]
+        assert not batch[1].is_valid
+    
+    def test_operation_subclass_is_validated(self, validator):
+        """Las subclases de una operación usan el validador de su clase base."""
+        class TaggedGate(RydbergGate):
+            pass
+
+        register = NeutralAtomRegister(
+            atoms=[
+                AtomPosition(id=0, x=0.0, y=0.0),
+                AtomPosition(id=1, x=20.0, y=0.0),  # Fuera del radio de bloqueo
+            ]
+        )
+        job = make_job(register, [TaggedGate(start_time=0, control_atom=0, target_atom=1)])
+        result = validator.validate(job)
+
+        assert not result.is_valid
+        assert len(result.get(BlockadeDistanceError)) == 1
+
+    def test_errors_bucketed_by_type(self, validator):
+        """get() equivale a filtrar errors con isinstance, también con la clase base."""
+        register = NeutralAtomRegister(
+            atoms=[
+                AtomPosition(id=0, x=0.0, y=0.0),
+                AtomPosition(id=1, x=2.0, y=0.0),  # Colisión
+                AtomPosition(id=2, x=20.0, y=0.0),
+            ]
+        )
+        job = make_job(register, [RydbergGate(start_time=0, control_atom=0, target_atom=2)])
+        result = validator.validate(job)
+        
+        for error_type in (CollisionError, BlockadeDistanceError, PhysicsConstraintError):
+            assert result.get(error_type) == [e for e in result.errors if isinstance(e, error_type)]
+        assert set(result.errors_by_type) == {CollisionError, BlockadeDistanceError}
+        assert result.get(VelocityExceededError) == []
+    
+    def test_warnings_bucketed_by_code(self, validator, zoned_register):
+        """warnings_with_code() equivale a filtrar warnings por código."""
+        job = make_job(zoned_register, [Measurement(start_time=0, atom_ids=[0, 1])])
+        result = validator.validate(job)
+        
+        for code in {w.code for w in result.warnings} | {"CONCURRENT_SHUTTLES"}:
+            assert result.warnings_with_code(code) == [w for w in result.warnings if w.code == code]
+        assert "MEASUREMENT_OUTSIDE_READOUT" in result.warnings_by_code
+    
+    def test_register_check_is_cached(self, validator):
+        """La geometría del registro se valida una vez; los errores no se comparten."""
+        register = NeutralAtomRegister(
+            atoms=[
+                AtomPosition(id=0, x=0.0, y=0.0),
+                AtomPosition(id=1, x=2.5, y=0.0),  # Colisión
+            ]
+        )
+        job = make_job(register, [Measurement(start_time=0, atom_ids=[0, 1])])
+        
+        first = validator.validate(job)
+        hits = PulserValidator._cached_register_check.cache_info().hits
+        second = validator.validate(job)
+        
+        assert PulserValidator._cached_register_check.cache_info().hits == hits + 1
+        assert [str(e) for e in first.errors] == [str(e) for e in second.errors]
+        assert first.errors[0] is not second.errors[0]
+        
+        moved = NeutralAtomRegister(
+            atoms=[AtomPosition(id=0, x=0.0, y=0.0), AtomPosition(id=1, x=5.0, y=0.0)]
+        )
+        assert validator.validate(make_job(moved, [Measurement(start_time=0, atom_ids=[0, 1])])).is_valid
 
 
 # =============================================================================
@@ -90,52 +90,55 @@ export function BenchmarkResults() {
     let authenticated = false;
     const originalOnMessage = ws.onmessage;
     ws.onmessage = (event) => {
-      const data: TelemetryPayload = JSON.parse(event.data);
+      // The server coalesces queued frames into a JSON array; a single
+      // frame arrives as a bare object
+      const parsed: TelemetryPayload | TelemetryPayload[] = JSON.parse(event.data);
+      for (const data of Array.isArray(parsed) ? parsed : [parsed]) {
+        // First response after auth - check status
+        if (!authenticated) {
+          if (data.status === "AUTH_REQUIRED" || (data.status === "ERROR" && data.cycle === 0)) {
+            setWsStatus("error");
+            toast({
+              title: "Error de Autenticación",
+              description: "Token de API inválido o ausente",
+              variant: "destructive"
+            });
+            return;
+          }
+          authenticated = true;
+          setWsStatus("connected");
+          // Send benchmark command after successful auth
+          const benchmarkType = BENCHMARK_MAP[activeTab] || "velocity_fidelity";
+          ws.send(JSON.stringify({ benchmark_type: benchmarkType, cycles: 50 }));
+        }
       
-      // First response after auth - check status
-      if (!authenticated) {
-        if (data.status === "AUTH_REQUIRED" || (data.status === "ERROR" && data.cycle === 0)) {
-          setWsStatus("error");
+        setTelemetry(data);
+
+        // Check for decoder backlog "Death Point" (>20ms cycle time)
+        if (data.decoder_backlog_ms > 20.0) {
           toast({
-            title: "Error de Autenticación",
-            description: "Token de API inválido o ausente",
-            variant: "destructive"
+            title: "🚨 QEC FAILURE: Death Point Reached",
+            description: `Backlog (${data.decoder_backlog_ms.toFixed(1)}ms) > Tiempo Ciclo (20ms)`,
+            variant: "destructive",
+          });
+        } else if (data.decoder_backlog_ms > 10.0) {
+          // Warning zone
+          toast({
+            title: "⚠️ Decoder Stress",
+            description: `Latencia alta: ${data.decoder_backlog_ms.toFixed(1)}ms`,
+            variant: "destructive",
           });
-          return;
         }
-        authenticated = true;
-        setWsStatus("connected");
-        // Send benchmark command after successful auth
-        const benchmarkType = BENCHMARK_MAP[activeTab] || "velocity_fidelity";
-        ws.send(JSON.stringify({ benchmark_type: benchmarkType, cycles: 50 }));
-      }
-      
-      setTelemetry(data);
-
-      // Check for decoder backlog "Death Point" (>20ms cycle time)
-      if (data.decoder_backlog_ms > 20.0) {
-        toast({
-          title: "🚨 QEC FAILURE: Death Point Reached",
-          description: `Backlog (${data.decoder_backlog_ms.toFixed(1)}ms) > Tiempo Ciclo (20ms)`,
-          variant: "destructive",
-        });
-      } else if (data.decoder_backlog_ms > 10.0) {
-        // Warning zone
-        toast({
-          title: "⚠️ Decoder Stress",
-          description: `Latencia alta: ${data.decoder_backlog_ms.toFixed(1)}ms`,
-          variant: "destructive",
-        });
-      }
 
-      // Check for completion
-      if (data.status === "COMPLETED" || data.status === "STOPPED") {
-        setIsRunning(false);
-        setWsStatus("disconnected");
-        toast({
-          title: data.status === "COMPLETED" ? "✓ Benchmark Completado" : "Benchmark Detenido",
-          description: `Ciclos: ${data.cycle} | Fidelidad: ${(data.fidelity * 100).toFixed(2)}%`,
-        });
+        // Check for completion
+        if (data.status === "COMPLETED" || data.status === "STOPPED") {
+          setIsRunning(false);
+          setWsStatus("disconnected");
+          toast({
+            title: data.status === "COMPLETED" ? "✓ Benchmark Completado" : "Benchmark Detenido",
+            description: `Ciclos: ${data.cycle} | Fidelidad: ${(data.fidelity * 100).toFixed(2)}%`,
+          });
+        }
       }
     };
 